@@ -1,6 +1,8 @@
 import sqlite3
 import os
 import logging
+import threading
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from config.settings import get_settings
 
@@ -11,22 +13,44 @@ class Database:
         self.db_path = db_path
         if self.db_path != ':memory:':
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        # Connect to the database, allowing multi-threaded access for Streamlit
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        self._configure_pragmas()
+        # Persistent per-thread connections: each worker thread reuses its own
+        # connection instead of contending on a single shared one (WAL allows
+        # concurrent readers alongside a writer).
+        self._local = threading.local()
+        self._all_conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self.conn = self._get_conn()  # main-thread connection, kept for compatibility
         self._create_tables()
 
-    def _configure_pragmas(self):
+    def _new_conn(self) -> sqlite3.Connection:
+        # cached_statements加大：应用的参数化语句种类较多（IN分块各算一种），
+        # 放大语句缓存让重复文本直接复用已解析的执行计划
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        self._configure_pragmas(conn)
+        with self._conns_lock:
+            self._all_conns.append(conn)
+        return conn
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return this thread's cached connection, creating it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._new_conn()
+            self._local.conn = conn
+        return conn
+
+    def _configure_pragmas(self, conn: sqlite3.Connection):
         """Tune SQLite for better performance and concurrency."""
         try:
-            cursor = self.conn.cursor()
+            cursor = conn.cursor()
             # WAL improves concurrent reads/writes; NORMAL is a safe tradeoff
             cursor.execute('PRAGMA journal_mode=WAL;')
             cursor.execute('PRAGMA synchronous=NORMAL;')
             cursor.execute('PRAGMA temp_store=MEMORY;')
+            cursor.execute('PRAGMA cache_size=-65536;')  # 64MB page cache
             cursor.execute('PRAGMA mmap_size=134217728;')  # 128MB
-            self.conn.commit()
+            conn.commit()
         except Exception as e:
             logging.getLogger(__name__).warning(f"Failed to set PRAGMAs: {e}")
 
@@ -189,6 +213,7 @@ class Database:
         # Indexes for performance
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_daily_price ON daily_price(ts_code, date)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_index_daily_price ON index_daily_price(ts_code, date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_stocks_symbol ON stocks(symbol)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_watchlist_ts ON watchlist(ts_code)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_index_watchlist_ts ON index_watchlist(ts_code)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_portfolio_snapshots ON portfolio_snapshots(portfolio_name, date)')
@@ -196,24 +221,46 @@ class Database:
 
         self.conn.commit()
 
+    @contextmanager
+    def transaction(self):
+        """把多条语句合并到一个事务里提交（N次fsync -> 1次）。
+
+        with块内通过execute/executemany写入即可；正常退出时提交一次，
+        出现异常则整体回滚。
+        """
+        conn = self._get_conn()
+        self._local.in_txn = True
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.in_txn = False
+
     def execute(self, query: str, params: tuple = None) -> None:
         """执行SQL语句"""
-        cursor = self.conn.cursor()
+        conn = self._get_conn()
+        cursor = conn.cursor()
         if params:
             cursor.execute(query, params)
         else:
             cursor.execute(query)
-        self.conn.commit()
+        if not getattr(self._local, 'in_txn', False):
+            conn.commit()
 
     def executemany(self, query: str, params: List[tuple]) -> None:
         """执行批量SQL语句"""
-        cursor = self.conn.cursor()
+        conn = self._get_conn()
+        cursor = conn.cursor()
         cursor.executemany(query, params)
-        self.conn.commit()
+        if not getattr(self._local, 'in_txn', False):
+            conn.commit()
 
     def fetch_one(self, query: str, params: tuple = None) -> Optional[Dict[str, Any]]:
         """获取单条查询结果"""
-        cursor = self.conn.cursor()
+        cursor = self._get_conn().cursor()
         if params:
             cursor.execute(query, params)
         else:
@@ -223,7 +270,7 @@ class Database:
 
     def fetch_all(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
         """获取所有查询结果"""
-        cursor = self.conn.cursor()
+        cursor = self._get_conn().cursor()
         if params:
             cursor.execute(query, params)
         else:
@@ -232,7 +279,13 @@ class Database:
         return [dict(row) for row in results]
 
     def close(self):
-        """关闭数据库连接"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """关闭所有线程的数据库连接"""
+        with self._conns_lock:
+            conns, self._all_conns = self._all_conns, []
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+        self.conn = None
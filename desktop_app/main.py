@@ -2,18 +2,25 @@ import os
 import csv
 import json
 import sys
+import re
+import io
+import functools
+import numpy as np
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from tkinter import Tk, StringVar, IntVar, BooleanVar, END, messagebox, filedialog, Toplevel, Menu, Text
 from tkinter import simpledialog
 from tkinter import ttk
 
-# Matplotlib embedding
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.ticker as mtick
-from matplotlib import font_manager, rcParams
-import matplotlib.dates as mdates
+# Matplotlib 延迟加载：导入会触发字体扫描等重初始化（冷启动数百毫秒），
+# 首次用到图表时才真正import（见_ensure_matplotlib），不挡应用启动
+FigureCanvasTkAgg = None
+Figure = None
+font_manager = None
+rcParams = None
+mdates = None
 import subprocess
 
 # Ensure project root on sys.path
@@ -28,9 +35,18 @@ from data.data_fetcher import DataFetcher
 from portfolio.manager import PortfolioManager
 from strategies.manager import StrategyManager
 from utils.code_processor import to_ts_code
+from utils.downsample import lttb_indices
+from utils.nav_kernels import running_drawdown, daily_returns
 from risk.analyzer import RiskAnalyzer
 
 PARAMS_FILE = os.path.abspath(os.path.join(PROJECT_ROOT, 'config', 'strategy_params.json'))
+_OUTPUT_DIR = os.path.abspath(os.path.join(PROJECT_ROOT, 'output'))
+
+@functools.lru_cache(maxsize=None)
+def _ensure_output_dir() -> str:
+    """输出目录每个进程只创建一次，之后的保存直接复用路径。"""
+    os.makedirs(_OUTPUT_DIR, exist_ok=True)
+    return _OUTPUT_DIR
 
 def _params_storage_load() -> dict:
     try:
@@ -51,10 +67,142 @@ def _params_storage_save(data: dict):
         pass
 
 
+# 统一的PNG保存参数：optimize让PIL挑更优的zlib过滤器，文件再小几个百分点
+_PNG_SAVE_KW = dict(bbox_inches='tight', format='png',
+                    pil_kwargs={'optimize': True, 'compress_level': 6})
+
+def _save_fig_png(fig, path: str, cache: dict, dpi: int = 150):
+    """保存图像为PNG，按(figure, dpi)缓存渲染字节。
+
+    同一张未变化的图重复保存（另存+快存到output）只渲染一次150DPI，
+    之后直接写文件；绘图路径更新图像时应clear()对应缓存。
+    """
+    key = (id(fig), dpi)
+    buf = cache.get(key)
+    if buf is None:
+        bio = io.BytesIO()
+        try:
+            fig.savefig(bio, dpi=dpi, **_PNG_SAVE_KW)
+        except TypeError:
+            # 旧版matplotlib的Agg后端不认pil_kwargs时退回默认参数
+            bio = io.BytesIO()
+            fig.savefig(bio, dpi=dpi, bbox_inches='tight', format='png')
+        buf = bio.getvalue()
+        cache[key] = buf
+    with open(path, 'wb') as f:
+        f.write(buf)
+
+
+# 预编译的YYYYMMDD日期校验（绑定match方法，省去每次的属性查找）
+_YYYYMMDD = re.compile(r'\d{8}\Z').match
+
+
+def _valid_date8(s: str) -> bool:
+    """8位日期串（YYYYMMDD）格式校验。"""
+    return bool(_YYYYMMDD(s))
+
+
+@functools.lru_cache(maxsize=None)
+def _pandas():
+    """惰性导入pandas并缓存模块对象。
+
+    首次import约300-800ms，放在模块顶层会拖慢启动，放在点击回调里会
+    卡UI；各处用 pd = _pandas() 取用，AppState启动时用后台线程预热。
+    """
+    import pandas
+    return pandas
+
+
+@functools.lru_cache(maxsize=None)
+def _compare_indices_fn():
+    """惰性加载compare_indices：首次对比时才导入，之后免去重复import开销。"""
+    from analysis.market_comparison import compare_indices
+    return compare_indices
+
+
+@functools.lru_cache(maxsize=None)
+def _run_backtest_fn():
+    """惰性加载run_backtest：首次回测时才导入回测引擎。"""
+    from backtest.engine import run_backtest
+    return run_backtest
+
+
+@functools.lru_cache(maxsize=128)
+def _fmt_metric(fmt: str, value) -> str:
+    """缓存指标文本：同一组合反复分析时数值不变，直接复用已生成的字符串。"""
+    return fmt.format(value)
+
+
+def _configure_treeview_columns(tree, spec):
+    """按 (列名, 标题, 宽度, 对齐) 规格配置Treeview列；规格在各类上声明为常量。"""
+    for col, text, width, anchor in spec:
+        tree.heading(col, text=text)
+        tree.column(col, width=width, anchor=anchor)
+
+
+def _df_to_csv_fast(df, path: str):
+    """导出DataFrame为CSV（utf-8-sig，便于Excel打开）。
+
+    优先使用 pyarrow 的CSV写入器（按列批量序列化，避免pandas逐行拼字符串），
+    未安装 pyarrow 时回退到 df.to_csv。
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        # 日期列先转日期串：pyarrow会写完整时间戳，而pandas路径对零点时刻
+        # 只写日期，两条路径的导出格式必须一致
+        dt_cols = [c for c in df.columns if str(df[c].dtype).startswith('datetime64')]
+        if dt_cols:
+            df = df.copy()
+            for c in dt_cols:
+                df[c] = df[c].dt.strftime('%Y-%m-%d')
+        tbl = pa.Table.from_pandas(df, preserve_index=False)
+        with open(path, 'wb') as f:
+            f.write(b'\xef\xbb\xbf')  # UTF-8 BOM for Excel compatibility
+            pacsv.write_csv(tbl, f, write_options=pacsv.WriteOptions(include_header=True))
+    except Exception:
+        # 分块+1MiB写缓冲：pandas边格式化边落盘，峰值内存不随行数增长
+        with open(path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+            df.to_csv(f, index=False, chunksize=10_000)
+
+
 # Configure Chinese fonts for Matplotlib (avoid garbled labels)
+_FONT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.tk_stock', 'font.cache')
+
+def _load_cached_font():
+    """读取上次解析出的中文字体名；matplotlib版本变化或字体已卸载则作废。"""
+    try:
+        import matplotlib
+        with open(_FONT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('mpl_version') != matplotlib.__version__:
+            return None
+        name = data.get('font')
+        # get_font_names走matplotlib内部缓存，比遍历ttflist建集合便宜得多
+        if name and name in font_manager.fontManager.get_font_names():
+            return name
+    except Exception:
+        pass
+    return None
+
+def _save_cached_font(name: str):
+    try:
+        import matplotlib
+        os.makedirs(os.path.dirname(_FONT_CACHE_FILE), exist_ok=True)
+        with open(_FONT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'font': name, 'mpl_version': matplotlib.__version__}, f)
+    except Exception:
+        pass
+
 def _configure_chinese_font():
     try:
         rcParams['axes.unicode_minus'] = False  # Proper minus sign with non-ASCII fonts
+        # 热启动：命中磁盘缓存就不再枚举全部已安装字体
+        cached = _load_cached_font()
+        if cached:
+            cur = list(rcParams.get('font.sans-serif', []))
+            rcParams['font.sans-serif'] = [cached] + cur
+            return cached
         candidates = [
             'PingFang SC',       # macOS
             'Heiti SC', 'STHeiti', 'Hiragino Sans GB', 'Songti SC',
@@ -70,12 +218,35 @@ def _configure_chinese_font():
                 # Prepend to sans-serif list so it's preferred
                 cur = list(rcParams.get('font.sans-serif', []))
                 rcParams['font.sans-serif'] = [name] + cur
+                _save_cached_font(name)
                 return name
     except Exception:
         pass
     return None
 
-_CH_FONT = _configure_chinese_font()
+_CH_FONT = None
+_mpl_lock = threading.Lock()
+
+def _ensure_matplotlib():
+    """首次需要图表时导入matplotlib并配置中文字体（幂等，线程安全）。
+
+    各图表页签/弹窗在创建Figure前调用；AppState也会在后台线程预热，
+    正常情况下用户点到图表页时导入早已完成。
+    """
+    global FigureCanvasTkAgg, Figure, font_manager, rcParams, mdates, _CH_FONT
+    if Figure is not None:
+        return
+    with _mpl_lock:
+        if Figure is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as _canvas_cls
+        from matplotlib.figure import Figure as _figure_cls
+        from matplotlib import font_manager as _fm, rcParams as _rc
+        import matplotlib.dates as _mdates
+        font_manager, rcParams, mdates = _fm, _rc, _mdates
+        _CH_FONT = _configure_chinese_font()
+        FigureCanvasTkAgg = _canvas_cls
+        Figure = _figure_cls  # 最后赋值：其非None即代表全部初始化完成
 
 
 class AppState:
@@ -86,6 +257,146 @@ class AppState:
         self.pm = PortfolioManager(self.db)
         self.sm = StrategyManager(self.db)
         self.ra = RiskAnalyzer(self.pm)
+        # 各页签共用的后台线程池：避免每次点击新建线程，并天然限制并发
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tkworker')
+        # 数据页的全市场/行情更新动辄数分钟，单独一个池跑，
+        # 不会占满共享池让回测/选股等快任务排队
+        self.data_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='dataworker')
+        # 后台预热pandas与matplotlib导入，用户首次点CSV导入/图表页时
+        # 不再有几百毫秒冻结（主线程此时可继续建窗口）
+        def _warmup():
+            _pandas()
+            _ensure_matplotlib()
+        threading.Thread(target=_warmup, daemon=True).start()
+        # 回测池脏标记：自选页改动池后置位，下次读取池代码时重查
+        self.pool_dirty = False
+        self._pool_codes_cache = None
+        # 轮播池同理：自选指数页改动后置位，对比页开始对比前重查
+        self.index_pool_dirty = False
+        # 后台写线程：UI线程只往队列投递(sql, params)即返回，
+        # 写线程按小批次合并成单个事务提交，WAL的fsync不再卡住主线程
+        import queue
+        self.writer_q = queue.Queue()
+        self.writer = threading.Thread(target=self._writer_loop, daemon=True, name='dbwriter')
+        self.writer.start()
+        # 基础信息映射缓存（股票/指数表较小，整表常驻内存，更新基础列表后失效）
+        self._stocks_by_symbol = None
+        self._stocks_by_ts = None
+        self._indices_by_ts = None
+
+    def _writer_loop(self):
+        """写队列消费循环：阻塞取到第一条后，再收集50ms内到达的写操作合并提交。
+
+        写线程在Database里有自己的线程本地连接（WAL + synchronous=NORMAL），
+        N条语句只做一次COMMIT/fsync。单条失败整批回滚并记录日志，不中断循环。
+        """
+        import queue as _queue
+        import time as _time
+        q = self.writer_q
+        while True:
+            batch = [q.get()]
+            deadline = _time.monotonic() + 0.05
+            while len(batch) < 256:
+                remain = deadline - _time.monotonic()
+                if remain <= 0:
+                    break
+                try:
+                    batch.append(q.get(timeout=remain))
+                except _queue.Empty:
+                    break
+            try:
+                with self.db.transaction():
+                    for sql, params in batch:
+                        self.db.execute(sql, params)
+            except Exception as e:
+                import logging
+                logging.getLogger(__name__).warning(f"后台写入失败（{len(batch)}条）：{e}")
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+    def flush_writes(self, timeout: float = 2.0):
+        """等待写队列清空且在途批次提交完成。
+
+        写线程先出队攒批再提交，empty()在批次执行期间就为真；
+        unfinished_tasks要到task_done()（提交之后）才归零，以它为准。
+        """
+        import time as _time
+        deadline = _time.monotonic() + timeout
+        while self.writer_q.unfinished_tasks and _time.monotonic() < deadline:
+            _time.sleep(0.02)
+
+    def watchlist_pool_codes(self):
+        """回测池代码列表（带缓存）。
+
+        自选页改动池成员时只置pool_dirty，这里在下次访问时等后台写线程
+        落盘后重查一次；池未变动则连续点击回测/选股零SQL往返。
+        """
+        if self.pool_dirty or self._pool_codes_cache is None:
+            self.flush_writes()  # 确保读到写队列里尚未落盘的池标记
+            rows = self.db.fetch_all("SELECT ts_code FROM watchlist WHERE in_pool = 1")
+            self._pool_codes_cache = [r['ts_code'] for r in rows]
+            self.pool_dirty = False
+        return list(self._pool_codes_cache)
+
+    def invalidate_basics_cache(self):
+        """基础信息列表更新后调用，下次访问时重新加载。"""
+        self._stocks_by_symbol = None
+        self._stocks_by_ts = None
+        self._indices_by_ts = None
+
+    def _load_stock_basics(self):
+        rows = self.db.fetch_all("SELECT ts_code, symbol, name FROM stocks")
+        self._stocks_by_symbol = {r['symbol']: (r['ts_code'], r['name']) for r in rows if r.get('symbol')}
+        self._stocks_by_ts = {r['ts_code']: (r['ts_code'], r['name']) for r in rows}
+
+    @property
+    def stocks_by_symbol(self):
+        if self._stocks_by_symbol is None:
+            self._load_stock_basics()
+        return self._stocks_by_symbol
+
+    @property
+    def stocks_by_ts(self):
+        if self._stocks_by_ts is None:
+            self._load_stock_basics()
+        return self._stocks_by_ts
+
+    @property
+    def indices_by_ts(self):
+        if self._indices_by_ts is None:
+            rows = self.db.fetch_all("SELECT ts_code, name FROM indices")
+            self._indices_by_ts = {r['ts_code']: (r['ts_code'], r['name']) for r in rows}
+        return self._indices_by_ts
+
+
+class BusyIndicator:
+    """全局忙碌指示器：停靠在状态栏右侧，各页签共用。
+
+    只有一个Progressbar动画定时器在跑（此前每个页签各养一个）；
+    引用计数支持并发任务，最后一个stop()才真正收起。
+    """
+
+    def __init__(self, master):
+        self.frame = ttk.Frame(master)
+        self.label_var = StringVar(value='')
+        ttk.Label(self.frame, textvariable=self.label_var).pack(side='left', padx=(8, 6))
+        self.bar = ttk.Progressbar(self.frame, mode='indeterminate', length=160)
+        self.bar.pack(side='left', padx=6)
+        self._active = 0
+
+    def start(self, msg: str):
+        self.label_var.set(msg)
+        self._active += 1
+        if self._active == 1:
+            self.frame.pack(side='right', padx=8)
+            self.bar.start(50)
+
+    def stop(self):
+        self._active = max(0, self._active - 1)
+        if self._active == 0:
+            self.bar.stop()
+            self.frame.forget()
 
 
 class StatusBar(ttk.Frame):
@@ -93,10 +404,30 @@ class StatusBar(ttk.Frame):
         super().__init__(master)
         self.var = StringVar()
         self.label = ttk.Label(self, textvariable=self.var, anchor='w')
-        self.label.pack(fill='x', padx=6, pady=3)
+        self.label.pack(side='left', fill='x', expand=True, padx=6, pady=3)
+        self.busy = BusyIndicator(self)
+        self._pending = None
+        self._flush_id = None
+
+    def set(self, text: str, throttle: bool = False):
+        """更新状态栏文本。
+
+        throttle=True合并100ms窗口内的连续更新（批处理循环里报进度用），
+        StringVar最多每秒触发约10次Label重绘；终态消息保持即时显示。
+        """
+        if not throttle:
+            self._pending = None
+            self.var.set(text)
+            return
+        self._pending = text
+        if self._flush_id is None:
+            self._flush_id = self.after(100, self._flush)
 
-    def set(self, text: str):
-        self.var.set(text)
+    def _flush(self):
+        self._flush_id = None
+        if self._pending is not None:
+            self.var.set(self._pending)
+            self._pending = None
 
 
 class DataTab(ttk.Frame):
@@ -135,14 +466,6 @@ class DataTab(ttk.Frame):
         ttk.Button(btns_row2, text='更新自选股行情数据', command=self.update_watchlist_prices).pack(side='left')
         ttk.Button(btns_row2, text='更新自选指数行情数据', command=self.update_index_watchlist_prices).pack(side='left', padx=8)
 
-        # Busy indicator
-        self._busy_frame = ttk.Frame(self)
-        self._busy_label_var = StringVar(value='')
-        self._busy_label = ttk.Label(self._busy_frame, textvariable=self._busy_label_var)
-        self._busy_bar = ttk.Progressbar(self._busy_frame, mode='indeterminate', length=200)
-        self._busy_label.pack(side='left', padx=(8, 6))
-        self._busy_bar.pack(side='left', padx=6)
-        # Not packed initially
 
     def _run_bg(self, fn, *args, **kwargs):
         def runner():
@@ -153,22 +476,18 @@ class DataTab(ttk.Frame):
             finally:
                 # stop busy
                 self._end_busy()
-        threading.Thread(target=runner, daemon=True).start()
+        # 长任务走专用池，不挤占各页签共享的快任务线程池
+        self.app.data_executor.submit(runner)
 
     def _start_busy(self, msg: str):
         try:
-            self._busy_label_var.set(msg)
-            self._busy_frame.pack(fill='x', padx=10, pady=(4, 8))
-            self._busy_bar.start(10)
+            self.status.busy.start(msg)
         except Exception:
             pass
 
     def _end_busy(self):
         try:
-            def stop():
-                self._busy_bar.stop()
-                self._busy_frame.forget()
-            self.after(0, stop)
+            self.after(0, self.status.busy.stop)
         except Exception:
             pass
 
@@ -176,6 +495,7 @@ class DataTab(ttk.Frame):
         def task():
             self.status.set('正在更新全市场股票基础信息...')
             cnt = self.app.df.update_all_stock_basics()
+            self.app.invalidate_basics_cache()
             self.status.set(f'股票基础信息更新完成，共处理 {cnt} 只股票。')
         self._start_busy('正在更新全市场股票基础信息...')
         self._run_bg(task)
@@ -184,6 +504,7 @@ class DataTab(ttk.Frame):
         def task():
             self.status.set('正在更新全市场指数基础信息...')
             cnt = self.app.df.update_all_index_basics()
+            self.app.invalidate_basics_cache()
             self.status.set(f'指数基础信息更新完成，共处理 {cnt} 个指数。')
         self._start_busy('正在更新全市场指数基础信息...')
         self._run_bg(task)
@@ -191,7 +512,7 @@ class DataTab(ttk.Frame):
     def update_watchlist_prices(self):
         def task():
             start = self.start_date_var.get().strip() if self.force_var.get() else None
-            if start and (len(start) != 8 or not start.isdigit()):
+            if start and not _valid_date8(start):
                 messagebox.showwarning('提示', '起始日期格式应为YYYYMMDD')
                 return
             self.status.set('正在更新自选股数据...')
@@ -203,7 +524,7 @@ class DataTab(ttk.Frame):
     def update_index_watchlist_prices(self):
         def task():
             start = self.start_date_var.get().strip() if self.force_var.get() else None
-            if start and (len(start) != 8 or not start.isdigit()):
+            if start and not _valid_date8(start):
                 messagebox.showwarning('提示', '起始日期格式应为YYYYMMDD')
                 return
             self.status.set('正在更新自选指数数据...')
@@ -265,9 +586,12 @@ class WatchlistFrame(ttk.Frame):
         self.tree.column('ts_code', width=120)
         self.tree.column('name', width=160)
         self.tree.pack(side='left', fill='both', expand=True)
-        scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        scrollbar.pack(side='right', fill='y')
+        self._scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.tree.yview)
+        # 虚拟化：行数据常驻 self._rows，Tk 只按视口分页物化（每页 _PAGE_SIZE 行）
+        self._rows = []
+        self._rendered = 0
+        self.tree.configure(yscroll=self._on_tree_scroll)
+        self._scrollbar.pack(side='right', fill='y')
 
         # Bulk actions
         action_frame = ttk.Frame(self)
@@ -290,22 +614,45 @@ class WatchlistFrame(ttk.Frame):
 
         self.refresh()
 
+    _PAGE_SIZE = 200
+
     def refresh(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        rows = self.app.db.fetch_all(f"SELECT ts_code, name, in_pool FROM {self.table_name} ORDER BY ts_code")
-        for row in rows:
-            vals = (row['ts_code'], row['name'], int(row['in_pool'] or 0))
-            self.tree.insert('', END, values=vals)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        rows = self.app.db.fetch_all(_stmt('select_rows', self.table_name))
+        self._rows = [(row['ts_code'], row['name'], row['in_pool']) for row in rows]
+        self._rendered = 0
+        self._render_more()
         self._update_stats()
 
+    def _render_more(self, count: int = None):
+        """向Treeview追加下一页行；count=None时取一页。"""
+        end = min(len(self._rows), self._rendered + (count or self._PAGE_SIZE))
+        insert = self.tree.insert
+        # iid直接用ts_code：选中项无需再回读values反查代码
+        for vals in self._rows[self._rendered:end]:
+            insert('', END, iid=vals[0], values=vals)
+        self._rendered = end
+
+    def _render_all(self):
+        """一次性物化剩余全部行（全选等需要完整列表的操作前调用）。"""
+        if self._rendered < len(self._rows):
+            self._render_more(len(self._rows) - self._rendered)
+
+    def _on_tree_scroll(self, first, last):
+        # yscrollcommand代理：任何视图变化（滚轮/拖动/窗口尺寸）都会经过这里，
+        # 接近底部时再物化下一页，避免首次刷新O(N)次Tk插入
+        self._scrollbar.set(first, last)
+        if self._rendered < len(self._rows) and float(last) > 0.9:
+            self.after_idle(self._render_more)
+
     def _update_stats(self):
+        # 从内存行直接统计：_rows与表格始终同步，既省一次查询，
+        # 也不会读到后台写线程尚未提交的旧数据
         try:
-            row = self.app.db.fetch_one(
-                f"SELECT COUNT(*) as total, SUM(CASE WHEN in_pool=1 THEN 1 ELSE 0 END) as in_pool FROM {self.table_name}"
-            )
-            total = int(row.get('total') or 0)
-            in_pool = int(row.get('in_pool') or 0)
+            total = len(self._rows)
+            in_pool = sum(1 for _, _, flag in self._rows if flag)
             if self.is_index:
                 txt = f"自选指数：{total} 个 | 轮播池：{in_pool} 个"
             else:
@@ -321,99 +668,173 @@ class WatchlistFrame(ttk.Frame):
             return
         try:
             if not self.is_index:
-                info = self.app.db.fetch_one("SELECT ts_code, name FROM stocks WHERE symbol = ?", (code,))
-                if not info:
-                    # Try if already ts_code
-                    info = self.app.db.fetch_one("SELECT ts_code, name FROM stocks WHERE ts_code = ?", (to_ts_code(code),))
+                info = self.app.stocks_by_symbol.get(code) or self.app.stocks_by_ts.get(to_ts_code(code))
             else:
-                info = self.app.db.fetch_one("SELECT ts_code, name FROM indices WHERE ts_code = ?", (code,))
+                info = self.app.indices_by_ts.get(code)
             if not info:
                 messagebox.showerror('错误', f'在本地基础信息中未找到代码 {code}。请先更新全市场{self.type_name}列表。')
                 return
+            ts_code, name = info
             self.app.db.execute(
-                f"INSERT OR IGNORE INTO {self.table_name} (ts_code, name, add_date, in_pool) VALUES (?, ?, ?, ?)",
-                (info['ts_code'], info['name'], datetime.now().strftime('%Y-%m-%d'), 0)
+                _stmt('insert', self.table_name),
+                (ts_code, name, datetime.now().strftime('%Y-%m-%d'), 0)
             )
-            self.status.set(f"已添加 {info['name']} ({info['ts_code']}) 到自选{self.type_name}列表。")
+            self.status.set(f"已添加 {name} ({ts_code}) 到自选{self.type_name}列表。")
             self.code_var.set('')
             self.refresh()
         except Exception as e:
             messagebox.showerror('错误', str(e))
 
+    def _run_bg(self, fn, *args, **kwargs):
+        def runner():
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                messagebox.showerror('错误', str(e))
+            finally:
+                self._end_busy()
+        self.app.executor.submit(runner)
+
+    def _start_busy(self, msg: str):
+        try:
+            self.status.busy.start(msg)
+        except Exception:
+            pass
+
+    def _end_busy(self):
+        try:
+            self.after(0, self.status.busy.stop)
+        except Exception:
+            pass
+
     def import_csv(self):
         path = filedialog.askopenfilename(title='选择CSV文件', filetypes=[('CSV 文件', '*.csv')])
         if not path:
             return
-        try:
-            import pandas as pd
-            df = pd.read_csv(path, dtype=str, engine='python')
-            col = 'ts_code' if self.is_index else 'symbol'
-            if col not in df.columns:
-                messagebox.showerror('错误', f"CSV文件必须包含 '{col}' 列。")
-                return
-            codes = [c for c in df[col].dropna().astype(str).str.strip().unique().tolist() if c]
-            success = 0
-            for code in codes:
-                if not self.is_index:
-                    info = self.app.db.fetch_one("SELECT ts_code, name FROM stocks WHERE symbol = ?", (code,))
-                    if not info:
-                        info = self.app.db.fetch_one("SELECT ts_code, name FROM stocks WHERE ts_code = ?", (to_ts_code(code),))
-                else:
-                    info = self.app.db.fetch_one("SELECT ts_code, name FROM indices WHERE ts_code = ?", (code,))
-                if info:
-                    self.app.db.execute(
-                        f"INSERT OR IGNORE INTO {self.table_name} (ts_code, name, add_date, in_pool) VALUES (?, ?, ?, ?)",
-                        (info['ts_code'], info['name'], datetime.now().strftime('%Y-%m-%d'), 0)
-                    )
-                    success += 1
-            self.status.set(f"批量导入完成，成功导入 {success}/{len(codes)} 个条目。")
+        # 解析与落库都移到后台线程，导入大表时界面仍可操作
+        self._start_busy('正在导入CSV...')
+        self._run_bg(self._import_csv_task, path)
+
+    def _import_csv_task(self, path: str):
+        """后台导入任务：解析CSV、解析代码、分批落库，批间回报进度。"""
+        # 只取一列代码，stdlib csv一趟扫完即可，无需pandas解析整表
+        col = 'ts_code' if self.is_index else 'symbol'
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            if not reader.fieldnames or col not in reader.fieldnames:
+                raise ValueError(f"CSV文件必须包含 '{col}' 列。")
+            seen = set()
+            codes = []
+            for row in reader:
+                c = (row.get(col) or '').strip()
+                if c and c not in seen:
+                    seen.add(c)
+                    codes.append(c)
+        # 批量查内存基础信息映射，再分批executemany落库（整体一个事务）
+        lookup = self._basics_lookup(codes)
+        today = datetime.now().strftime('%Y-%m-%d')
+        rows = [
+            (lookup[code][0], lookup[code][1], today, 0)
+            for code in codes if code in lookup
+        ]
+        total = len(rows)
+        done = 0
+        with self.app.db.transaction():
+            for i in range(0, total, 200):
+                batch = rows[i:i + 200]
+                self.app.db.executemany(_stmt('insert', self.table_name), batch)
+                done += len(batch)
+                self.after(0, lambda n=done: self.status.set(f'已导入 {n}/{total} 个条目...', throttle=True))
+        # 回到Tk线程刷新表格与状态
+        def finish():
+            self.status.set(f"批量导入完成，成功导入 {total}/{len(codes)} 个条目。")
             self.refresh()
-        except Exception as e:
-            messagebox.showerror('错误', str(e))
+        self.after(0, finish)
+
+    def _basics_lookup(self, codes):
+        """批量解析代码，返回 {输入代码: (ts_code, name)}。
+
+        直接查 AppState 缓存的基础信息映射（整表常驻内存），不再发SQL。
+        股票同时支持6位symbol与完整ts_code。
+        """
+        lookup = {}
+        if self.is_index:
+            by_ts = self.app.indices_by_ts
+            for c in codes:
+                info = by_ts.get(c)
+                if info:
+                    lookup[c] = info
+        else:
+            by_symbol = self.app.stocks_by_symbol
+            by_ts = self.app.stocks_by_ts
+            for c in codes:
+                info = by_symbol.get(c) or by_ts.get(to_ts_code(c))
+                if info:
+                    lookup[c] = info
+        return lookup
 
     def _selected_codes(self):
-        items = self.tree.selection()
-        codes = []
-        for item in items:
-            vals = self.tree.item(item, 'values')
-            codes.append(vals[0])
-        return codes
+        # 行iid即ts_code，选中元组本身就是代码列表
+        return list(self.tree.selection())
 
     def toggle_select_all(self):
-        items = list(self.tree.get_children())
-        selected = set(self.tree.selection())
+        self._render_all()  # 全选需要完整行集，先物化未渲染的分页
+        items = self.tree.get_children()
+        selected = self.tree.selection()
         if items and len(selected) == len(items):
-            # all selected -> clear
-            self.tree.selection_remove(*selected)
+            # all selected -> clear（单次Tcl调用）
+            self.tree.selection_set(())
         else:
-            # not all selected -> select all
-            for item in items:
-                if item not in selected:
-                    self.tree.selection_add(item)
+            # not all selected -> 整个元组一次selection_set，免去逐项selection_add
+            self.tree.selection_set(items)
+
+    def _set_pool_flag_inplace(self, items, flag: int):
+        """就地更新选中行的in_pool列：O(选中数)，不重查库不重建表格。"""
+        for iid in items:
+            self.tree.set(iid, 'in_pool', flag)
+            idx = self.tree.index(iid)
+            if 0 <= idx < len(self._rows):
+                ts_code, name, _ = self._rows[idx]
+                self._rows[idx] = (ts_code, name, flag)
+        self._update_stats()
 
     def add_to_pool(self):
+        items = self.tree.selection()
         codes = self._selected_codes()
         if not codes:
             messagebox.showinfo('提示', '请先选择要加入回测池的股票')
             return
-        placeholders = ','.join('?' for _ in codes)
-        self.app.db.execute(f"UPDATE {self.table_name} SET in_pool = 1 WHERE ts_code IN ({placeholders})", tuple(codes))
-        msg = '指数加入轮播池' if self.is_index else '股票加入回测池'
+        self._in_update('pool_on', codes)
         self.status.set(f"已将 {len(codes)} 个{('指数' if self.is_index else '股票')}加入{('轮播池' if self.is_index else '回测池')}。")
-        self.refresh()
+        self._set_pool_flag_inplace(items, 1)
 
     def remove_from_pool(self):
+        items = self.tree.selection()
         codes = self._selected_codes()
         if not codes:
             messagebox.showinfo('提示', '请先选择要移出回测池的股票')
             return
-        placeholders = ','.join('?' for _ in codes)
-        self.app.db.execute(f"UPDATE {self.table_name} SET in_pool = 0 WHERE ts_code IN ({placeholders})", tuple(codes))
+        self._in_update('pool_off', codes)
         self.status.set(f"已将 {len(codes)} 个{('指数' if self.is_index else '股票')}移出{('轮播池' if self.is_index else '回测池')}。")
-        self.refresh()
+        self._set_pool_flag_inplace(items, 0)
 
     # note: 全部加入/移出操作已移除，应通过选择后批量操作
 
+    def _in_update(self, op: str, codes):
+        """按900个占位符分块生成 IN(...) 语句，投递给后台写线程。
+
+        SQLite默认host参数上限为999；分块后大选择集也安全。UI立即返回，
+        写线程会把各分块合并进一个事务提交（界面状态就地更新，不依赖回读）。
+        语句文本经_stmt缓存，常见分块大小只拼接一次。
+        """
+        for i in range(0, len(codes), 900):
+            chunk = codes[i:i + 900]
+            self.app.writer_q.put((_stmt(op, self.table_name, len(chunk)), tuple(chunk)))
+        if self.is_index:
+            self.app.index_pool_dirty = True  # 轮播池成员可能变化，对比页需重查
+        else:
+            self.app.pool_dirty = True  # 股票池成员可能变化，回测页需重查
+
     def delete_selected(self):
         codes = self._selected_codes()
         if not codes:
@@ -421,20 +842,38 @@ class WatchlistFrame(ttk.Frame):
             return
         if not messagebox.askyesno('确认', f'确定删除选中的 {len(codes)} 个条目吗？'):
             return
-        placeholders = ','.join('?' for _ in codes)
-        self.app.db.execute(f"DELETE FROM {self.table_name} WHERE ts_code IN ({placeholders})", tuple(codes))
+        items = self.tree.selection()
+        self._in_update('delete', codes)
+        # 就地摘除选中行（选中项必然已渲染），无需整表刷新
+        for idx in sorted((self.tree.index(i) for i in items), reverse=True):
+            if 0 <= idx < len(self._rows):
+                del self._rows[idx]
+        self.tree.delete(*items)
+        self._rendered = max(0, self._rendered - len(items))
+        self._update_stats()
         self.status.set(f"已删除 {len(codes)} 个条目。")
-        self.refresh()
 
     def clear_all(self):
         if not messagebox.askyesno('确认', f'确定清空所有自选{self.type_name}吗？'):
             return
-        self.app.db.execute(f"DELETE FROM {self.table_name}")
+        self.app.writer_q.put((f"DELETE FROM {self.table_name}", ()))
+        if self.is_index:
+            self.app.index_pool_dirty = True
+        else:
+            self.app.pool_dirty = True
+        # 清空走就地更新而非refresh：后台删除可能尚未提交，回读会看到旧数据
+        self._rows = []
+        self._rendered = 0
+        items = self.tree.get_children()
+        if items:
+            self.tree.delete(*items)
+        self._update_stats()
         self.status.set(f"已清空所有自选{self.type_name}。")
-        self.refresh()
 
     def export_csv(self):
         try:
+            # 池勾选/删除可能还在后台写队列里，导出前先等其落盘
+            self.app.flush_writes()
             if self.is_index:
                 rows = self.app.db.fetch_all(
                     f"SELECT ts_code, name, in_pool FROM {self.table_name} ORDER BY ts_code"
@@ -483,6 +922,7 @@ class WatchlistFrame(ttk.Frame):
         if not self.is_index:
             return
         try:
+            self.app.flush_writes()  # 同导出CSV：先等队列中的删改落盘
             rows = self.app.db.fetch_all(
                 f"SELECT ts_code FROM {self.table_name} ORDER BY ts_code"
             )
@@ -541,6 +981,22 @@ class WatchlistFrame(ttk.Frame):
             messagebox.showerror('错误', str(e))
 
 
+# 自选表SQL按(操作, 表名, 占位符数)缓存：免去每次调用的f-string拼接，
+# 相同文本还能命中sqlite3连接内置的语句缓存，复用已解析的执行计划
+_SQL_TEMPLATES = {
+    'pool_on': "UPDATE {table} SET in_pool = 1 WHERE ts_code IN ({ph})",
+    'pool_off': "UPDATE {table} SET in_pool = 0 WHERE ts_code IN ({ph})",
+    'delete': "DELETE FROM {table} WHERE ts_code IN ({ph})",
+    # COALESCE下推到SQL：空值归零在C层完成，Python侧不再逐行int(... or 0)
+    'select_rows': "SELECT ts_code, name, COALESCE(in_pool, 0) AS in_pool FROM {table} ORDER BY ts_code",
+    'insert': "INSERT OR IGNORE INTO {table} (ts_code, name, add_date, in_pool) VALUES (?, ?, ?, ?)",
+}
+
+@functools.lru_cache(maxsize=256)
+def _stmt(op: str, table: str, n: int = 0) -> str:
+    return _SQL_TEMPLATES[op].format(table=table, ph=','.join('?' * n))
+
+
 class WatchlistTab(ttk.Frame):
     def __init__(self, master, app: AppState, status: StatusBar):
         super().__init__(master)
@@ -553,13 +1009,42 @@ class WatchlistTab(ttk.Frame):
 
 
 class PortfolioTab(ttk.Frame):
+    # 持仓表列规格：类常量，配置集中一处
+    _POS_COLS = (
+        ('ts_code', '股票代码', 120, 'center'), ('name', '股票名称', 140, 'center'),
+        ('qty', '持仓数量', 90, 'center'), ('cost_price', '成本价', 80, 'center'),
+        ('current_price', '现价', 80, 'center'), ('market_value', '市值', 100, 'center'),
+        ('pnl', '浮动盈亏', 100, 'center'), ('trailing_stop', '跟踪止盈价', 100, 'center'),
+        ('ma20_stop', '20日均线价', 100, 'center'), ('target_price', '目标价', 100, 'center'),
+    )
+
+    # 报告缓存有效期（秒）：连续点击"刷新报告"后马上看图/导出时复用同一份
+    _REPORT_TTL = 5.0
+
     def __init__(self, master, app: AppState, status: StatusBar):
         super().__init__(master)
         self.app = app
         self.status = status
+        self._last_report = None
+        self._last_report_ts = 0.0
+        self._png_cache = {}  # (figure,dpi)->已渲染PNG字节，重复保存免二次渲染
+        self._pos_last = {}  # ts_code->(values, tags)，持仓表差量刷新的上一帧快照
+        # 弹窗复用：饼图/净值曲线窗口只建一次，关闭即withdraw，重开重画
+        self._pie_win = self._pie_fig = self._pie_canvas = None
+        self._nav_win = self._nav_bm_var = self._nav_render = None
+        self._nav_df = None
 
         self._build()
 
+    def _get_report(self, force: bool = False):
+        """取投资组合报告；TTL内复用上一次的结果，避免重复SQL+pandas计算。"""
+        import time
+        now = time.monotonic()
+        if force or self._last_report is None or now - self._last_report_ts > self._REPORT_TTL:
+            self._last_report = self.app.pm.generate_portfolio_report()
+            self._last_report_ts = time.monotonic()
+        return self._last_report
+
     def _build(self):
         if not self.app.pm.is_initialized():
             init_frame = ttk.LabelFrame(self, text='设置初始模拟资金')
@@ -569,12 +1054,6 @@ class PortfolioTab(ttk.Frame):
             ttk.Entry(init_frame, textvariable=self.init_cash_var, width=16).pack(side='left')
             ttk.Button(init_frame, text='开始交易', command=self.initialize_cash).pack(side='left', padx=8)
         else:
-            # 基础样式微调
-            try:
-                style = ttk.Style()
-                style.configure('TButton', padding=(8, 4))
-            except Exception:
-                pass
             quick_frame = ttk.LabelFrame(self, text='快捷交易')
             quick_frame.pack(fill='x', padx=10, pady=8)
             # 快速操作：买入 / 存入现金 / 取出现金 / 全部卖出
@@ -607,17 +1086,8 @@ class PortfolioTab(ttk.Frame):
             ttk.Label(rep_frame, textvariable=self.summary_var).pack(anchor='w', padx=8)
 
             # Positions table
-            self.pos_tree = ttk.Treeview(rep_frame, columns=(
-                'ts_code', 'name', 'qty', 'cost_price', 'current_price', 'market_value', 'pnl',
-                'trailing_stop', 'ma20_stop', 'target_price'
-            ), show='headings')
-            for col, text, w in [
-                ('ts_code', '股票代码', 120), ('name', '股票名称', 140), ('qty', '持仓数量', 90),
-                ('cost_price', '成本价', 80), ('current_price', '现价', 80), ('market_value', '市值', 100), ('pnl', '浮动盈亏', 100),
-                ('trailing_stop', '跟踪止盈价', 100), ('ma20_stop', '20日均线价', 100), ('target_price', '目标价', 100)
-            ]:
-                self.pos_tree.heading(col, text=text)
-                self.pos_tree.column(col, width=w, anchor='center')
+            self.pos_tree = ttk.Treeview(rep_frame, columns=[c[0] for c in self._POS_COLS], show='headings')
+            _configure_treeview_columns(self.pos_tree, self._POS_COLS)
             self.pos_tree.tag_configure('warn', foreground='red')
             self.pos_tree.pack(fill='both', expand=True, padx=8, pady=6)
             # 双击持仓行 -> 打开快捷交易弹窗（默认卖出、默认数量为全部）
@@ -665,32 +1135,57 @@ class PortfolioTab(ttk.Frame):
         messagebox.showinfo('提示', '请使用“快捷交易”中的“买入”按钮或在持仓列表中双击个股进行交易。')
 
     def refresh_report(self):
-        rep = self.app.pm.generate_portfolio_report()
+        rep = self._get_report(force=True)
         total = rep['summary']['total_value']
         cash = rep['cash']
         invest = rep['summary']['investment_value']
         count = rep['summary']['position_count']
         self.summary_var.set(f"总资产: ¥{total:.2f} | 现金: ¥{cash:.2f} | 持仓市值: ¥{invest:.2f} | 持仓数: {count}")
         # update positions
-        for item in self.pos_tree.get_children():
-            self.pos_tree.delete(item)
-        for p in rep['positions']:
-            cur = float(p.get('current_price') or 0)
-            ts = float(p.get('trailing_stop') or 0)
-            ma = float(p.get('ma20_stop') or 0)
-            tgt = float(p.get('target_price') or 0)
-            # 仅当当前价低于 跟踪止盈 或 20日均线 时标红；目标价不参与预警。
-            warn = any([
-                (ts > 0 and cur < ts),
-                (ma > 0 and cur < ma),
-            ])
-            tags = ('warn',) if warn else ()
-            self.pos_tree.insert('', END, values=(
-                p.get('ts_code'), p.get('name'), p.get('qty'),
-                f"{p.get('cost_price', 0):.2f}", f"{cur:.2f}",
-                f"{p.get('market_value', 0):.2f}", f"{p.get('pnl', 0):.2f}",
-                f"{ts:.2f}", f"{ma:.2f}", f"{tgt:.2f}"
-            ), tags=tags)
+        positions = rep['positions']
+        if not positions:
+            children = self.pos_tree.get_children()
+            if children:
+                self.pos_tree.delete(*children)
+            self._pos_last = {}
+            return
+        # 数值列一次性向量化：转float、格式化、预警掩码都在NumPy里算完，
+        # 循环体只剩按下标取现成字符串
+        pd = _pandas()
+        df = pd.DataFrame(positions)
+        num_cols = ('cost_price', 'current_price', 'market_value', 'pnl',
+                    'trailing_stop', 'ma20_stop', 'target_price')
+        for c in num_cols:
+            df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0.0) if c in df.columns else 0.0
+        cur = df['current_price'].to_numpy()
+        ts = df['trailing_stop'].to_numpy()
+        ma = df['ma20_stop'].to_numpy()
+        # 仅当当前价低于 跟踪止盈 或 20日均线 时标红；目标价不参与预警。
+        warn = ((ts > 0) & (cur < ts)) | ((ma > 0) & (cur < ma))
+        fmt = {c: df[c].map('{:.2f}'.format).tolist() for c in num_cols}
+        codes = df['ts_code'].tolist()
+        names = df['name'].tolist()
+        qtys = df['qty'].tolist()
+        # 差量刷新：以ts_code为iid对比上一次的行内容，只对变化的行发Tcl调用，
+        # 数据没变时刷新报告不再整表重建（O(总行数) -> O(变化行数)）
+        new = {}
+        for i in range(len(codes)):
+            new[codes[i]] = ((
+                codes[i], names[i], qtys[i],
+                fmt['cost_price'][i], fmt['current_price'][i],
+                fmt['market_value'][i], fmt['pnl'][i],
+                fmt['trailing_stop'][i], fmt['ma20_stop'][i], fmt['target_price'][i]
+            ), ('warn',) if warn[i] else ())
+        last = self._pos_last
+        for code in last.keys() - new.keys():
+            self.pos_tree.delete(code)
+        for i, (code, (vals, tags)) in enumerate(new.items()):
+            if code in last:
+                if last[code] != (vals, tags):
+                    self.pos_tree.item(code, values=vals, tags=tags)
+            else:
+                self.pos_tree.insert('', i, iid=code, values=vals, tags=tags)
+        self._pos_last = new
 
     def edit_target_price(self):
         try:
@@ -698,8 +1193,8 @@ class PortfolioTab(ttk.Frame):
             if not sel:
                 messagebox.showinfo('提示', '请先选择一条持仓记录')
                 return
-            # Handle multiple selections one by one
-            updated = 0
+            # 逐条询问，攒成一批后一次性落库（N次提交 -> 1次）
+            updates = []
             for item in sel:
                 vals = self.pos_tree.item(item, 'values')
                 if not vals:
@@ -716,10 +1211,10 @@ class PortfolioTab(ttk.Frame):
                 if ans <= 0:
                     messagebox.showwarning('提示', '目标价必须为正数')
                     continue
-                self.app.pm.set_target_price(ts_code, float(ans))
-                updated += 1
-            if updated:
-                self.status.set(f'已更新 {updated} 条目标价')
+                updates.append((ts_code, float(ans)))
+            if updates:
+                self.app.pm.set_target_prices_bulk(updates)
+                self.status.set(f'已更新 {len(updates)} 条目标价')
                 self.refresh_report()
         except Exception as e:
             messagebox.showerror('错误', str(e))
@@ -737,7 +1232,7 @@ class PortfolioTab(ttk.Frame):
             dt = simpledialog.askstring('补记起始现金流', '日期(YYYYMMDD)：')
             if not dt:
                 return
-            if not (len(dt) == 8 and dt.isdigit()):
+            if not _valid_date8(dt):
                 messagebox.showwarning('提示', '请输入有效的8位日期，如 20240105')
                 return
             amt = simpledialog.askfloat('补记起始现金流', '金额（正为存入，负为取出）：')
@@ -752,24 +1247,22 @@ class PortfolioTab(ttk.Frame):
 
     def draw_positions_pie(self, report=None):
         try:
-            rep = report or self.app.pm.generate_portfolio_report()
+            rep = report or self._get_report()
             positions = rep.get('positions') or []
             # 保留旧方法以兼容，但默认不在主界面绘制
             if hasattr(self, 'pos_ax') and hasattr(self, 'pos_fig') and hasattr(self, 'pos_canvas'):
                 self.pos_ax.clear()
-                if positions:
+                sizes = [max(float(p.get('market_value') or 0), 0.0) for p in positions]
+                if positions and sum(sizes) > 0:
                     labels = [f"{(p.get('name') or p.get('ts_code'))}({p.get('ts_code')})" for p in positions]
-                    sizes = [max(float(p.get('market_value') or 0), 0.0) for p in positions]
-                    total = sum(sizes)
-                    if total > 0:
-                        self.pos_ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, pctdistance=0.85)
-                        self.pos_ax.set_title('持仓分布（按市值）')
-                    else:
-                        self.pos_ax.text(0.5, 0.5, '当前无持仓', ha='center', va='center')
+                    wedges = self.pos_ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, pctdistance=0.85)
+                    for w in wedges[0]:
+                        w.set_rasterized(True)
+                    self.pos_ax.set_title('持仓分布（按市值）')
                 else:
                     self.pos_ax.text(0.5, 0.5, '当前无持仓', ha='center', va='center')
                 self.pos_fig.tight_layout()
-                self.pos_canvas.draw()
+                self.pos_canvas.draw_idle()
         except Exception as e:
             messagebox.showerror('绘图失败', str(e))
 
@@ -848,7 +1341,7 @@ class PortfolioTab(ttk.Frame):
                 messagebox.showinfo('提示', '无法读取选中行')
                 return
             ts_code = vals[0]
-            rep = self.app.pm.generate_portfolio_report()
+            rep = self._get_report()
             positions = rep.get('positions') or []
             pos = None
             for p in positions:
@@ -858,9 +1351,9 @@ class PortfolioTab(ttk.Frame):
             if not pos:
                 messagebox.showinfo('提示', '未找到对应持仓详情')
                 return
-            import pandas as pd, time
-            outdir = os.path.abspath(os.path.join(PROJECT_ROOT, 'output'))
-            os.makedirs(outdir, exist_ok=True)
+            pd = _pandas()
+            import time
+            outdir = _ensure_output_dir()
             ts = time.strftime('%Y%m%d_%H%M%S')
             path = os.path.join(outdir, f'position_{ts_code}_{ts}.csv')
             pd.DataFrame([pos]).to_csv(path, index=False, encoding='utf-8-sig')
@@ -1030,39 +1523,63 @@ class PortfolioTab(ttk.Frame):
             df = self.app.pm.get_snapshots()
             # 保留旧方法以兼容，但默认不在主界面绘制
             if hasattr(self, 'nav_ax') and hasattr(self, 'nav_fig') and hasattr(self, 'nav_canvas'):
-                self.nav_ax.clear()
                 if df is not None and not df.empty:
                     s = df['total_value']
-                    self.nav_ax.plot(s.index, s.values, label='组合净值', color='royalblue')
-                    # 仅按日期刻度显示
-                    self.nav_ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-                    self.nav_ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+                    # 回撤/收益统计走可被Numba JIT的内核，在降采样前的全量序列上算
+                    vals = s.to_numpy(np.float64)
+                    max_dd = float(running_drawdown(vals).max()) if vals.size else 0.0
+                    # 按像素预算LTTB降采样：画布宽度约750px时，多年快照也只需
+                    # O(像素)个点，视觉上与全量绘制无差别
+                    width_px = self.nav_canvas.get_tk_widget().winfo_width()
+                    if width_px <= 1:
+                        width_px = int(self.nav_fig.get_figwidth() * self.nav_fig.dpi)
+                    if len(s) > 2 * width_px:
+                        idx = lttb_indices(s.index.view('int64'), s.values, width_px)
+                        s = s.iloc[idx]
+                    # 持久化Line2D：刷新时只set_data+重缩放，不再clear()重建整棵
+                    # 矢量对象树；曲线本身栅格化，坐标轴/标签保持矢量
+                    line = getattr(self, '_nav_line', None)
+                    if line is None or line.axes is not self.nav_ax:
+                        self.nav_ax.clear()
+                        (line,) = self.nav_ax.plot(
+                            s.index, s.values, label='组合净值', color='royalblue', rasterized=True)
+                        self._nav_line = line
+                        # 仅按日期刻度显示
+                        self.nav_ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+                        self.nav_ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+                        self.nav_ax.set_xlabel('日期')
+                        self.nav_ax.set_ylabel('总资产')
+                        self.nav_ax.legend()
+                        self.nav_fig.tight_layout()
+                    else:
+                        line.set_data(s.index, s.values)
+                        self.nav_ax.relim()
+                        self.nav_ax.autoscale_view()
+                    self.nav_ax.set_title(f'组合净值曲线（最大回撤 {max_dd:.1%}）')
                     self.nav_fig.autofmt_xdate()
-                    self.nav_ax.set_title('组合净值曲线')
-                    self.nav_ax.set_xlabel('日期')
-                    self.nav_ax.set_ylabel('总资产')
-                    self.nav_ax.legend()
                 else:
+                    self.nav_ax.clear()
+                    self._nav_line = None
                     self.nav_ax.text(0.5, 0.5, '暂无快照数据，请先重建。', ha='center', va='center')
-                self.nav_fig.tight_layout()
-                self.nav_canvas.draw()
+                    self.nav_fig.tight_layout()
+                self.nav_canvas.draw_idle()
         except Exception as e:
             messagebox.showerror('绘图失败', str(e))
 
     def export_positions_csv(self):
         try:
-            rep = self.app.pm.generate_portfolio_report()
+            rep = self._get_report()
             positions = rep.get('positions') or []
             if not positions:
                 messagebox.showinfo('提示', '当前无持仓可导出')
                 return
-            import pandas as pd, time
+            pd = _pandas()
+            import time
             df = pd.DataFrame(positions)
-            outdir = os.path.abspath(os.path.join(PROJECT_ROOT, 'output'))
-            os.makedirs(outdir, exist_ok=True)
+            outdir = _ensure_output_dir()
             ts = time.strftime('%Y%m%d_%H%M%S')
             path = os.path.join(outdir, f'positions_{ts}.csv')
-            df.to_csv(path, index=False, encoding='utf-8-sig')
+            _df_to_csv_fast(df, path)  # pyarrow C写出（带BOM），缺pyarrow时回退pandas
             self.status.set(f'已导出持仓明细至 {path}')
         except Exception as e:
             messagebox.showerror('导出失败', str(e))
@@ -1072,7 +1589,7 @@ class PortfolioTab(ttk.Frame):
         if not path:
             return
         try:
-            fig.savefig(path, dpi=150, bbox_inches='tight')
+            _save_fig_png(fig, path, self._png_cache)
             self.status.set(f'图像已保存：{path}')
             self._open_path(path)
         except Exception as e:
@@ -1093,95 +1610,135 @@ class PortfolioTab(ttk.Frame):
     def _save_fig_quick(self, fig: Figure, base_name: str):
         try:
             import time
-            outdir = os.path.abspath(os.path.join(PROJECT_ROOT, 'output'))
-            os.makedirs(outdir, exist_ok=True)
+            outdir = _ensure_output_dir()
             ts = time.strftime('%Y%m%d_%H%M%S')
             path = os.path.join(outdir, f'{base_name}_{ts}.png')
-            fig.savefig(path, dpi=150, bbox_inches='tight')
+            _save_fig_png(fig, path, self._png_cache)
             self.status.set(f'图像已保存：{path}')
         except Exception as e:
             messagebox.showerror('保存失败', str(e))
-    def deposit_cash(self):
+    def _run_async(self, fn, busy_msg: str, on_done):
+        """确认对话框后把DB操作交给共享线程池执行，完成后回Tk线程更新界面。
+
+        fn在工作线程运行，返回值通过after(0, on_done, result)送回主线程；
+        异常同样切回主线程弹窗，busy指示灯全程可见。
+        """
         try:
-            amt = simpledialog.askfloat('存入现金', '金额：', minvalue=0.0)
-            if amt is None:
-                return
-            if amt <= 0:
-                messagebox.showwarning('提示', '金额需为正数')
+            self.status.busy.start(busy_msg)
+        except Exception:
+            pass
+        def runner():
+            try:
+                result = fn()
+            except Exception as e:
+                self.after(0, lambda err=e: messagebox.showerror('操作失败', str(err)))
                 return
-            self.app.pm.update_cash(amt)
-            self.status.set(f'已存入现金 ¥{amt:.2f}')
-            self.refresh_report()
-        except Exception as e:
-            messagebox.showerror('操作失败', str(e))
+            finally:
+                try:
+                    self.after(0, self.status.busy.stop)
+                except Exception:
+                    pass
+            self.after(0, on_done, result)
+        self.app.executor.submit(runner)
+
+    def deposit_cash(self):
+        amt = simpledialog.askfloat('存入现金', '金额：', minvalue=0.0)
+        if amt is None:
+            return
+        if amt <= 0:
+            messagebox.showwarning('提示', '金额需为正数')
+            return
+        self._run_async(
+            lambda: self.app.pm.update_cash(amt), '正在存入现金...',
+            lambda _r: (self.status.set(f'已存入现金 ¥{amt:.2f}'), self.refresh_report()))
 
     def withdraw_cash(self):
-        try:
-            amt = simpledialog.askfloat('取出现金', '金额：', minvalue=0.0)
-            if amt is None:
-                return
-            if amt <= 0:
-                messagebox.showwarning('提示', '金额需为正数')
-                return
-            self.app.pm.update_cash(-amt)
-            self.status.set(f'已取出现金 ¥{amt:.2f}')
-            self.refresh_report()
-        except Exception as e:
-            messagebox.showerror('操作失败', str(e))
+        amt = simpledialog.askfloat('取出现金', '金额：', minvalue=0.0)
+        if amt is None:
+            return
+        if amt <= 0:
+            messagebox.showwarning('提示', '金额需为正数')
+            return
+        self._run_async(
+            lambda: self.app.pm.update_cash(-amt), '正在取出现金...',
+            lambda _r: (self.status.set(f'已取出现金 ¥{amt:.2f}'), self.refresh_report()))
 
     def sell_all_positions(self):
-        try:
-            if not messagebox.askyesno('确认', '确认按最新价卖出全部持仓？'):
-                return
-            cnt = self.app.pm.sell_all_positions_at_market()
-            self.status.set(f'已卖出 {cnt} 个持仓')
-            self.refresh_report()
-        except Exception as e:
-            messagebox.showerror('操作失败', str(e))
+        if not messagebox.askyesno('确认', '确认按最新价卖出全部持仓？'):
+            return
+        self._run_async(
+            self.app.pm.sell_all_positions_at_market, '正在卖出全部持仓...',
+            lambda cnt: (self.status.set(f'已卖出 {cnt} 个持仓'), self.refresh_report()))
 
     def reset_portfolio(self):
-        try:
-            if not messagebox.askyesno('确认', '确认重置为未初始化状态？（删除当前组合与交易记录）'):
-                return
-            self.app.pm.reset_portfolio()
+        if not messagebox.askyesno('确认', '确认重置为未初始化状态？（删除当前组合与交易记录）'):
+            return
+        def done(_r):
             self.status.set('组合已重置')
             for w in self.winfo_children():
                 w.destroy()
             self._build()
-        except Exception as e:
-            messagebox.showerror('操作失败', str(e))
+        self._run_async(self.app.pm.reset_portfolio, '正在重置组合...', done)
 
     def open_positions_pie_window(self):
         try:
-            rep = self.app.pm.generate_portfolio_report()
+            _ensure_matplotlib()
+            self._png_cache.clear()  # 图像内容将更新，失效已渲染的保存缓存
+            rep = self._get_report()
             positions = rep.get('positions') or []
-            win = Toplevel(self)
-            win.title('持仓分布图')
-            fig = Figure(figsize=(6.0, 4.0), dpi=100)
-            ax = fig.add_subplot(111)
+            # 复用同一个Toplevel+Figure+画布：关闭只withdraw，重开clear重画
+            win = self._pie_win
+            if win is None or not win.winfo_exists():
+                win = Toplevel(self)
+                win.title('持仓分布图')
+                win.protocol('WM_DELETE_WINDOW', win.withdraw)
+                # constrained_layout在绘制管线内解算一次，避免每次重绘tight_layout
+                fig = Figure(figsize=(6.0, 4.0), dpi=100, constrained_layout=True)
+                fig.add_subplot(111)
+                canvas = FigureCanvasTkAgg(fig, master=win)
+                canvas.get_tk_widget().pack(fill='both', expand=True)
+                row = ttk.Frame(win)
+                row.pack(fill='x')
+                ttk.Button(row, text='保存PNG', command=lambda: self.save_figure(fig, 'positions_pie.png')).pack(side='left', padx=8, pady=6)
+                ttk.Button(row, text='快速保存到output', command=lambda: self._save_fig_quick(fig, 'positions_pie')).pack(side='left')
+                self._pie_win, self._pie_fig, self._pie_canvas = win, fig, canvas
+            else:
+                win.deiconify()
+                win.lift()
+            ax = self._pie_fig.axes[0]
+            ax.clear()
             if positions:
+                # 市值直接进numpy数组：截负与求和都是数组操作，不再逐项max/sum
                 labels = [f"{(p.get('name') or p.get('ts_code'))}({p.get('ts_code')})" for p in positions]
-                sizes = [max(float(p.get('market_value') or 0), 0.0) for p in positions]
-                total = sum(sizes)
+                sizes = np.fromiter((float(p.get('market_value') or 0.0) for p in positions),
+                                    dtype=np.float64, count=len(positions))
+                np.clip(sizes, 0.0, None, out=sizes)
+                total = float(sizes.sum())
+                # 只画市值前8名，其余合并为“其他”：几十只持仓的饼图
+                # 既不可读，逐扇区文字/百分比也拖慢绘制与保存
+                top_k = 8
+                if len(labels) > top_k:
+                    order = np.argsort(sizes)[::-1]
+                    keep = order[:top_k]
+                    rest = order[top_k:]
+                    labels = [labels[i] for i in keep] + ['其他']
+                    sizes = np.append(sizes[keep], sizes[rest].sum())
                 if total > 0:
-                    ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, pctdistance=0.85)
+                    wedges = ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, pctdistance=0.85)
+                    for w in wedges[0]:
+                        w.set_rasterized(True)  # 扇区栅格化，文字标签保持矢量
                     ax.set_title('持仓分布（按市值）')
                 else:
                     ax.text(0.5, 0.5, '当前无持仓', ha='center', va='center')
             else:
                 ax.text(0.5, 0.5, '当前无持仓', ha='center', va='center')
-            canvas = FigureCanvasTkAgg(fig, master=win)
-            canvas.get_tk_widget().pack(fill='both', expand=True)
-            canvas.draw()
-            row = ttk.Frame(win)
-            row.pack(fill='x')
-            ttk.Button(row, text='保存PNG', command=lambda: self.save_figure(fig, 'positions_pie.png')).pack(side='left', padx=8, pady=6)
-            ttk.Button(row, text='快速保存到output', command=lambda: self._save_fig_quick(fig, 'positions_pie')).pack(side='left')
+            self._pie_canvas.draw_idle()
         except Exception as e:
             messagebox.showerror('绘图失败', str(e))
 
     def open_nav_curve_window(self):
         try:
+            _ensure_matplotlib()
             df = self.app.pm.get_snapshots()
             # 若暂无快照，自动尝试重建一次
             if df is None or df.empty:
@@ -1190,8 +1747,17 @@ class PortfolioTab(ttk.Frame):
                 except Exception:
                     pass
                 df = self.app.pm.get_snapshots()
+            self._nav_df = df  # render闭包经self取最新快照，窗口复用时数据不陈旧
+            # 复用同一个Toplevel+Figure+画布：关闭只withdraw，重开重画
+            win = self._nav_win
+            if win is not None and win.winfo_exists():
+                win.deiconify()
+                win.lift()
+                self._nav_render(self._nav_bm_var.get())
+                return
             win = Toplevel(self)
             win.title('组合净值曲线')
+            win.protocol('WM_DELETE_WINDOW', win.withdraw)
             ctrl = ttk.Frame(win)
             ctrl.pack(fill='x', padx=8, pady=(6, 0))
             ttk.Label(ctrl, text='基准指数：').pack(side='left')
@@ -1211,14 +1777,26 @@ class PortfolioTab(ttk.Frame):
             bm_cb.pack(side='left', padx=(4, 8))
             ttk.Button(ctrl, text='刷新', command=lambda: render(bm_var.get())).pack(side='left')
 
-            fig = Figure(figsize=(7.5, 4.0), dpi=100)
+            fig = Figure(figsize=(7.5, 4.0), dpi=100, constrained_layout=True)
             ax = fig.add_subplot(111)
 
             def render(benchmark: str):
+                df = self._nav_df
+                self._png_cache.clear()  # 图像即将变化，失效已渲染的保存缓存
                 ax.clear()
                 if df is not None and not df.empty:
                     s = df['total_value']
-                    ax.plot(s.index, s.values, label='组合净值', color='royalblue')
+                    # 按像素预算LTTB降采样绘图序列：多年快照也只画O(像素)个点，
+                    # 视觉无差别；统计与现金流对齐仍用全量序列s
+                    sp = s
+                    width_px = canvas.get_tk_widget().winfo_width()
+                    if width_px <= 1:
+                        width_px = int(fig.get_figwidth() * fig.dpi)
+                    if len(sp) > 2 * width_px:
+                        idx = lttb_indices(sp.index.view('int64'), sp.values, width_px)
+                        sp = sp.iloc[idx]
+                    # 曲线栅格化（坐标轴/文字保持矢量），仅对矢量导出生效
+                    ax.plot(sp.index, sp.values, label='组合净值', color='royalblue', rasterized=True)
                     # 基准
                     try:
                         start = s.index.min().strftime('%Y%m%d')
@@ -1227,7 +1805,7 @@ class PortfolioTab(ttk.Frame):
                             "SELECT date, close FROM index_daily_price WHERE ts_code = ? AND date BETWEEN ? AND ? ORDER BY date",
                             (benchmark, start, end)
                         )
-                        import pandas as pd
+                        pd = _pandas()
                         bdf = pd.DataFrame(rows)
                         if not bdf.empty:
                             bdf['date'] = pd.to_datetime(bdf['date'])
@@ -1241,7 +1819,7 @@ class PortfolioTab(ttk.Frame):
                     try:
                         flows = self.app.pm.get_cash_flows()
                         if flows:
-                            import pandas as pd
+                            pd = _pandas()
                             fdf = pd.DataFrame(flows)
                             fdf['date'] = pd.to_datetime(fdf['date'])
                             fdf = fdf[(fdf['date'] >= s.index.min()) & (fdf['date'] <= s.index.max())]
@@ -1253,7 +1831,12 @@ class PortfolioTab(ttk.Frame):
                                 ax.scatter(fdf['date'][neg_mask], y[neg_mask], color='red', marker='v', label='现金流出')
                     except Exception:
                         pass
-                    ax.set_title('组合净值曲线（含基准与现金流标注）')
+                    # 区间收益/最大回撤：JIT内核一次扫完净值数组，再拼进标题
+                    vals = s.to_numpy(np.float64)
+                    rets = daily_returns(vals)
+                    total_ret = float(np.prod(1.0 + rets) - 1.0) if rets.size else 0.0
+                    max_dd = float(running_drawdown(vals).max()) if vals.size else 0.0
+                    ax.set_title(f'组合净值曲线（区间收益 {total_ret:+.1%} / 最大回撤 {max_dd:.1%}，含基准与现金流标注）')
                     ax.set_xlabel('日期')
                     ax.set_ylabel('总资产')
                     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
@@ -1262,10 +1845,11 @@ class PortfolioTab(ttk.Frame):
                     ax.legend()
                 else:
                     ax.text(0.5, 0.5, '暂无快照数据，请先重建。', ha='center', va='center')
-                canvas.draw()
+                canvas.draw_idle()
 
             canvas = FigureCanvasTkAgg(fig, master=win)
             canvas.get_tk_widget().pack(fill='both', expand=True)
+            self._nav_win, self._nav_bm_var, self._nav_render = win, bm_var, render
             render(bm_var.get())
             row = ttk.Frame(win)
             row.pack(fill='x')
@@ -1275,24 +1859,14 @@ class PortfolioTab(ttk.Frame):
             messagebox.showerror('绘图失败', str(e))
 
     def show_indicator_help(self):
-        txt = (
-            '指标计算与使用说明\n\n'
-            '1) 跟踪止盈价：\n'
-            '   - 计算公式：max( 买入后最高收盘价 × 85%, 买入价 × 92% )；\n'
-            '   - 含义：仅当价格上涨时启用跟踪，止盈位随最高价抬升；\n'
-            '     在价格回落且收盘价跌破止盈位时，视为触发止盈，可考虑平仓。\n\n'
-            '2) 20日均线价：\n'
-            '   - 计算公式：最近20个交易日的简单移动平均(SMA)；\n'
-            '   - 用途：作为趋势过滤或离场参考，价格跌破可提示风险。\n\n'
-            '3) 目标价（价值止盈）：\n'
-            '   - 用户手动设定的止盈目标，不作为预警阈值；\n'
-            '   - 当价格达到/超过目标价时，可考虑分批或全部止盈。\n\n'
-            '4) 预警着色规则：\n'
-            '   - 当前价 < 跟踪止盈价 或 当前价 < 20日均线价 时，行记录标红提示；\n'
-            '   - 目标价不触发红色预警，仅作参考。\n\n'
-            '提示：本页的一键操作包括“全部卖出(按最新价)”“存入/取出现金”“重置为未初始化”。\n'
-        )
+        # 重复点击只提升已有窗口，不重建Toplevel与整段文案
+        win = getattr(self, '_help_win', None)
+        if win is not None and win.winfo_exists():
+            win.lift()
+            return
+        txt = _INDICATOR_HELP_TXT
         win = Toplevel(self)
+        self._help_win = win
         win.title('指标计算与使用说明')
         frm = ttk.Frame(win)
         frm.pack(fill='both', expand=True, padx=10, pady=10)
@@ -1302,7 +1876,34 @@ class PortfolioTab(ttk.Frame):
         ttk.Button(frm, text='关闭', command=win.destroy).pack(anchor='e', pady=(8, 0))
 
 
+# 指标说明文案：编译期折叠的模块常量，每次弹窗直接引用
+_INDICATOR_HELP_TXT = (
+    '指标计算与使用说明\n\n'
+    '1) 跟踪止盈价：\n'
+    '   - 计算公式：max( 买入后最高收盘价 × 85%, 买入价 × 92% )；\n'
+    '   - 含义：仅当价格上涨时启用跟踪，止盈位随最高价抬升；\n'
+    '     在价格回落且收盘价跌破止盈位时，视为触发止盈，可考虑平仓。\n\n'
+    '2) 20日均线价：\n'
+    '   - 计算公式：最近20个交易日的简单移动平均(SMA)；\n'
+    '   - 用途：作为趋势过滤或离场参考，价格跌破可提示风险。\n\n'
+    '3) 目标价（价值止盈）：\n'
+    '   - 用户手动设定的止盈目标，不作为预警阈值；\n'
+    '   - 当价格达到/超过目标价时，可考虑分批或全部止盈。\n\n'
+    '4) 预警着色规则：\n'
+    '   - 当前价 < 跟踪止盈价 或 当前价 < 20日均线价 时，行记录标红提示；\n'
+    '   - 目标价不触发红色预警，仅作参考。\n\n'
+    '提示：本页的一键操作包括“全部卖出(按最新价)”“存入/取出现金”“重置为未初始化”。\n'
+)
+
+
 class StrategyTab(ttk.Frame):
+    # 选股结果表列规格：类常量，配置集中一处
+    _RESULT_COLS = (
+        ('ts_code', '代码', 120, 'center'),
+        ('name', '名称', 160, 'center'),
+        ('signal_date', '信号日期', 120, 'center'),
+    )
+
     def __init__(self, master, app: AppState, status: StatusBar):
         super().__init__(master)
         self.app = app
@@ -1339,10 +1940,8 @@ class StrategyTab(ttk.Frame):
         # Results table
         table_frame = ttk.Frame(self)
         table_frame.pack(fill='both', expand=True, padx=10, pady=8)
-        self.tree = ttk.Treeview(table_frame, columns=('ts_code', 'name', 'signal_date'), show='headings')
-        for col, text, w in [('ts_code', '代码', 120), ('name', '名称', 160), ('signal_date', '信号日期', 120)]:
-            self.tree.heading(col, text=text)
-            self.tree.column(col, width=w, anchor='center')
+        self.tree = ttk.Treeview(table_frame, columns=[c[0] for c in self._RESULT_COLS], show='headings')
+        _configure_treeview_columns(self.tree, self._RESULT_COLS)
         self.tree.pack(side='left', fill='both', expand=True)
         scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.tree.yview)
         self.tree.configure(yscroll=scrollbar.set)
@@ -1359,13 +1958,6 @@ class StrategyTab(ttk.Frame):
         hint = ttk.Label(self, text='提示：选股基于自选股池（在“自选列表管理”中配置），请先更新行情数据。')
         hint.pack(anchor='w', padx=12, pady=(0, 8))
 
-        # Busy indicator
-        self._busy_frame = ttk.Frame(self)
-        self._busy_label_var = StringVar(value='')
-        self._busy_label = ttk.Label(self._busy_frame, textvariable=self._busy_label_var)
-        self._busy_bar = ttk.Progressbar(self._busy_frame, mode='indeterminate', length=200)
-        self._busy_label.pack(side='left', padx=(8, 6))
-        self._busy_bar.pack(side='left', padx=6)
 
     def run_screening(self):
         name = self.strategy_var.get()
@@ -1394,12 +1986,15 @@ class StrategyTab(ttk.Frame):
 
         def task():
             self.status.set(f"正在运行选股：{name}，股票数：{len(codes)} ...")
-            results = self.app.sm.run_screening(name, codes, strategy_params=params)
+            # 进度走节流后的状态栏：工作线程只投递文本，100ms合并一次刷新
+            def progress(done, total):
+                self.status.set(f"正在运行选股：{name} {done}/{total} ...", throttle=True)
+            results = self.app.sm.run_screening(name, codes, strategy_params=params, progress_cb=progress)
             self.status.set(f"选股完成，入选 {len(results)} 只。")
             # populate table on UI thread
             self.tree.after(0, self._fill_results, results)
         self._start_busy('正在运行选股...')
-        threading.Thread(target=lambda: (task(), self._end_busy()), daemon=True).start()
+        self.app.executor.submit(lambda: (task(), self._end_busy()))
 
     # ---- Strategy params helpers ----
     def _param_specs(self):
@@ -1574,24 +2169,29 @@ class StrategyTab(ttk.Frame):
             return '该策略暂无详细说明。'
 
     def _fill_results(self, rows):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for r in rows:
-            self.tree.insert('', END, values=(r.get('ts_code'), r.get('name'), r.get('signal_date')))
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        # 分批插入：每500行让Tk处理一次挂起的绘制，避免几千个信号把事件循环卡死；
+        # 插入期间隐藏显示列，列布局只在恢复时重算一次
+        insert = self.tree.insert
+        self.tree.configure(displaycolumns=())
+        try:
+            for i, r in enumerate(rows):
+                insert('', END, values=(r.get('ts_code'), r.get('name'), r.get('signal_date')))
+                if (i + 1) % 500 == 0:
+                    self.tree.update_idletasks()
+        finally:
+            self.tree.configure(displaycolumns='#all')
         # cache codes for carousel
         self._chart_codes = [r.get('ts_code') for r in rows if r.get('ts_code')]
         self._chart_pos = 0
 
     def _start_busy(self, msg: str):
-        self._busy_label_var.set(msg)
-        self._busy_frame.pack(fill='x', padx=10, pady=(0, 8))
-        self._busy_bar.start(10)
+        self.status.busy.start(msg)
 
     def _end_busy(self):
-        def stop():
-            self._busy_bar.stop()
-            self._busy_frame.forget()
-        self.after(0, stop)
+        self.after(0, self.status.busy.stop)
 
     # ---- Chart helpers ----
     def _on_result_dblclick(self, _event=None):
@@ -1630,6 +2230,7 @@ class StrategyTab(ttk.Frame):
         self._open_chart_window(reuse=True)
 
     def _open_chart_window(self, reuse: bool = False):
+        _ensure_matplotlib()
         import matplotlib.dates as mdates
         from matplotlib.patches import Rectangle
         # Build or reuse window
@@ -1637,7 +2238,8 @@ class StrategyTab(ttk.Frame):
             self._chart_win = Toplevel(self)
             self._chart_win.title('个股K线与成交量')
             # Create figure
-            fig = Figure(figsize=(8.0, 5.0), dpi=100)
+            # constrained_layout在绘制管线内解算，轮播重绘不再手动tight_layout
+            fig = Figure(figsize=(8.0, 5.0), dpi=100, constrained_layout=True)
             ax_price = fig.add_subplot(211)
             ax_vol = fig.add_subplot(212, sharex=ax_price)
             self._chart_fig = fig
@@ -1665,7 +2267,7 @@ class StrategyTab(ttk.Frame):
         if not rows:
             messagebox.showinfo('提示', f'{code} 暂无行情数据，请先更新。')
             return
-        import pandas as pd
+        pd = _pandas()
         df = pd.DataFrame(rows)
         df['date'] = pd.to_datetime(df['date'])
         df = df.sort_values('date')
@@ -1698,8 +2300,7 @@ class StrategyTab(ttk.Frame):
         axv.bar(df['date'], df['volume'], color=colors, width=0.6)
         axv.set_ylabel('成交量')
         axv.grid(True, linestyle='--', alpha=0.2)
-        self._chart_fig.tight_layout()
-        self._chart_canvas.draw()
+        self._chart_canvas.draw_idle()
 
     def _set_chart_days(self, n: int):
         try:
@@ -1716,6 +2317,7 @@ class StrategyTab(ttk.Frame):
 class IndexCompareTab(ttk.Frame):
     def __init__(self, master, app: AppState, status: StatusBar):
         super().__init__(master)
+        _ensure_matplotlib()  # 本页内嵌图表，确保Figure/mdates可用
         self.app = app
         self.status = status
 
@@ -1726,12 +2328,14 @@ class IndexCompareTab(ttk.Frame):
         # Date range simple entries
         ttk.Label(top, text='起始(YYYYMMDD)：').pack(side='left', padx=(12, 4))
         self.idx_start_var = StringVar(value='20240101')
-        ttk.Entry(top, textvariable=self.idx_start_var, width=12).pack(side='left')
+        start_entry = ttk.Entry(top, textvariable=self.idx_start_var, width=12)
+        start_entry.pack(side='left')
         ttk.Button(top, text='年初', command=self._set_start_year_begin).pack(side='left', padx=(6, 0))
         ttk.Label(top, text='结束(YYYYMMDD)：').pack(side='left', padx=(12, 4))
         from datetime import date
         self.idx_end_var = StringVar(value=date.today().strftime('%Y%m%d'))
-        ttk.Entry(top, textvariable=self.idx_end_var, width=12).pack(side='left')
+        end_entry = ttk.Entry(top, textvariable=self.idx_end_var, width=12)
+        end_entry.pack(side='left')
         ttk.Button(top, text='今日', command=self._set_end_today).pack(side='left', padx=(6, 0))
 
         # 进入页面将自动加载指数列表
@@ -1751,6 +2355,8 @@ class IndexCompareTab(ttk.Frame):
         self.listbox.pack(fill='x')
         # 点击列切换（#3 轮播池）或设置（#4 基准）
         self.listbox.bind('<Button-1>', self._on_index_list_click)
+        # 大列表按页物化：滚动接近底部时再补下一页
+        self.listbox.configure(yscrollcommand=self._on_cand_scroll)
 
         ctrl = ttk.Frame(self)
         ctrl.pack(fill='x', padx=10, pady=6)
@@ -1764,6 +2370,17 @@ class IndexCompareTab(ttk.Frame):
         # Plot area
         self.fig = Figure(figsize=(8, 4.8), dpi=100)
         self.ax = self.fig.add_subplot(111)
+        # 持久化Line2D：轮播切换只set_data+重缩放，不再clear()重建整套矢量对象
+        (self._line_ratio,) = self.ax.plot([], [], label='ratio', color='red')
+        (self._line_ma10,) = self.ax.plot([], [], label='MA10')
+        (self._line_ma20,) = self.ax.plot([], [], label='MA20')
+        (self._line_ma60,) = self.ax.plot([], [], label='MA60', color='gray')
+        self._cmp_lines = (self._line_ratio, self._line_ma10, self._line_ma20, self._line_ma60)
+        self.ax.set_xlabel('日期')
+        self.ax.set_ylabel('比值')
+        _locator = mdates.AutoDateLocator()
+        self.ax.xaxis.set_major_locator(_locator)
+        self.ax.xaxis.set_major_formatter(mdates.AutoDateFormatter(_locator))
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=6)
 
@@ -1775,18 +2392,54 @@ class IndexCompareTab(ttk.Frame):
 
         self._candidates = []
         self._pos = 0
+        # 轮播池快照：与列表勾选状态同步，避免每次对比都查库
+        self._pool_codes = set()
+        # 对比结果缓存：按(基准,指数,起,止)记忆，轮播来回切换/导出即取即用
+        self._cmp_cache = OrderedDict()
+        # 缓存被预取线程与绘图工作线程并发读写，所有操作须持同一把锁
+        self._cmp_lock = threading.Lock()
+        self._prefetch_lock = threading.Lock()
+        self._req_id = 0  # 绘图请求序号：快速连点时丢弃过期结果
+        self._png_cache = {}  # (figure,dpi)->已渲染PNG字节，重复保存免二次渲染
+        self._last_xlim = None  # 上次绘制的x范围：不变时跳过x轴重标定
+        start_entry.bind('<FocusOut>', lambda _e: self._clear_cmp_cache())
+        end_entry.bind('<FocusOut>', lambda _e: self._clear_cmp_cache())
 
-        # Busy indicator
-        self._busy_frame = ttk.Frame(self)
-        self._busy_label_var = StringVar(value='')
-        self._busy_label = ttk.Label(self._busy_frame, textvariable=self._busy_label_var)
-        self._busy_bar = ttk.Progressbar(self._busy_frame, mode='indeterminate', length=200)
-        self._busy_label.pack(side='left', padx=(8, 6))
-        self._busy_bar.pack(side='left', padx=6)
         # 初始自动加载
         self._load_candidates()
 
+    # 对比结果缓存上限：防止长会话轮播大量指数时DataFrame占用无界内存
+    _CMP_CACHE_MAX = 32
+
+    def _clear_cmp_cache(self):
+        with self._cmp_lock:
+            self._cmp_cache.clear()
+
+    def _get_compare(self, base_code: str, code: str, start: str, end: str):
+        """带记忆的compare_indices：同一(基准,指数,区间)只计算一次，LRU淘汰。"""
+        key = (base_code, code, start, end)
+        with self._cmp_lock:
+            df = self._cmp_cache.get(key)
+            if df is not None:
+                self._cmp_cache.move_to_end(key)
+        if df is None:
+            # 计算放在锁外：只有缓存簿记持锁，慢的compare_indices不串行化
+            df = _compare_indices_fn()(self.app.db, base_code, code, start, end)
+            if df is not None:
+                if not df.empty:
+                    # 日期->浮点坐标只转一次，随DataFrame一起缓存
+                    df.attrs['x_num'] = mdates.date2num(df['date'].values)
+                with self._cmp_lock:
+                    self._cmp_cache[key] = df
+                    if len(self._cmp_cache) > self._CMP_CACHE_MAX:
+                        self._cmp_cache.popitem(last=False)
+        return df
+
     def _load_candidates(self):
+        self._clear_cmp_cache()  # 行情可能已更新，重载列表时一并失效缓存
+        self._iid_to_code = {}
+        self._rowid_by_code = {}
+        self.app.flush_writes()  # 池勾选走后台写队列，重载前先等其落盘
         rows_all = self.app.db.fetch_all("SELECT ts_code, name, in_pool FROM index_watchlist ORDER BY ts_code")
         if not rows_all:
             messagebox.showinfo('提示', '自选指数列表为空，请先在“自选列表管理”添加指数。')
@@ -1794,32 +2447,63 @@ class IndexCompareTab(ttk.Frame):
         codes = [r['ts_code'] for r in rows_all]
         if not self.base_code:
             self.base_code = '000985.CSI' if '000985.CSI' in codes else codes[0]
-        for item in self.listbox.get_children():
-            self.listbox.delete(item)
-        first_pool_row = None
-        for r in rows_all:
-            code = r['ts_code']; name = r['name']; in_pool = int(r['in_pool'] or 0)
-            tick = '✓' if in_pool else ''
-            base_mark = '●' if code == self.base_code else ''
-            rowid = self.listbox.insert('', END, values=(code, name, tick, base_mark))
-            if in_pool and first_pool_row is None:
-                first_pool_row = rowid
-        # 自动定位到第一个已勾选的指数
-        if first_pool_row:
+        children = self.listbox.get_children()
+        if children:
+            self.listbox.delete(*children)
+        self._pool_codes = {r['ts_code'] for r in rows_all if int(r['in_pool'] or 0)}
+        self.app.index_pool_dirty = False  # 快照与库内一致，脏标记可清
+        # 行数据常驻Python侧，Treeview只按页物化（可见高度仅10行）
+        self._cand_rows = rows_all
+        self._cand_rendered = 0
+        first_page = min(len(rows_all), self._CAND_PAGE)
+        # 需要自动定位到第一个已勾选的指数，分页边界放宽到该行
+        first_pool_idx = next(
+            (i for i, r in enumerate(rows_all) if int(r['in_pool'] or 0)), None)
+        if first_pool_idx is not None and first_pool_idx >= first_page:
+            first_page = first_pool_idx + 1
+        self._render_candidates(first_page)
+        if first_pool_idx is not None:
             try:
-                self.listbox.selection_set(first_pool_row)
-                self.listbox.focus(first_pool_row)
-                self.listbox.see(first_pool_row)
+                rowid = self.listbox.get_children()[first_pool_idx]
+                self.listbox.selection_set(rowid)
+                self.listbox.focus(rowid)
+                self.listbox.see(rowid)
             except Exception:
                 pass
 
+    # 候选指数列表分页大小
+    _CAND_PAGE = 100
+
+    def _render_candidates(self, count: int = None):
+        """向候选列表追加下一页行；count=None时取一页。"""
+        rows = self._cand_rows
+        end = min(len(rows), self._cand_rendered + (count or self._CAND_PAGE))
+        if end <= self._cand_rendered:
+            return
+        # 插入期间隐藏显示列，一批行只触发一次列布局重算
+        self.listbox.configure(displaycolumns=())
+        try:
+            insert = self.listbox.insert
+            for r in rows[self._cand_rendered:end]:
+                code = r['ts_code']; name = r['name']; in_pool = int(r['in_pool'] or 0)
+                tick = '✓' if in_pool else ''
+                base_mark = '●' if code == self.base_code else ''
+                rowid = insert('', END, values=(code, name, tick, base_mark))
+                self._iid_to_code[rowid] = code
+                self._rowid_by_code[code] = rowid
+        finally:
+            self.listbox.configure(displaycolumns='#all')
+        self._cand_rendered = end
+
+    def _on_cand_scroll(self, first, last):
+        # yscrollcommand代理：滚动接近底部时物化下一页
+        if getattr(self, '_cand_rows', None) and self._cand_rendered < len(self._cand_rows) \
+                and float(last) > 0.9:
+            self.after_idle(self._render_candidates)
+
     def _selected_codes(self):
-        items = self.listbox.selection()
-        codes = []
-        for item in items:
-            vals = self.listbox.item(item, 'values')
-            codes.append(vals[0])
-        return codes
+        # Python侧iid->code映射，免去每个选中项一次Tcl往返
+        return [self._iid_to_code[i] for i in self.listbox.selection() if i in self._iid_to_code]
 
     def _on_index_list_click(self, event):
         region = self.listbox.identify('region', event.x, event.y)
@@ -1829,28 +2513,33 @@ class IndexCompareTab(ttk.Frame):
         rowid = self.listbox.identify_row(event.y)
         if not rowid:
             return
-        vals = list(self.listbox.item(rowid, 'values'))
-        code = vals[0]
+        code = self._iid_to_code.get(rowid)
+        if not code:
+            return
         # 轮播池列
         if col == '#3':
-            curr = 1 if (len(vals) >= 3 and vals[2] == '✓') else 0
-            newv = 0 if curr == 1 else 1
-            self.app.db.execute("UPDATE index_watchlist SET in_pool = ? WHERE ts_code = ?", (newv, code))
-            vals[2] = '✓' if newv else ''
-            self.listbox.item(rowid, values=vals)
+            newv = 0 if code in self._pool_codes else 1
+            # 经后台写线程落盘：连续点选多行合并为一个事务，点击不等fsync
+            self.app.writer_q.put(("UPDATE index_watchlist SET in_pool = ? WHERE ts_code = ?", (newv, code)))
+            if newv:
+                self._pool_codes.add(code)
+            else:
+                self._pool_codes.discard(code)
+            # 单格写入，不重写整行四个单元格
+            self.listbox.set(rowid, 'in_pool', '✓' if newv else '')
             self.status.set(f"{code} 已{'加入' if newv else '移出'}轮播池")
         # 基准列（单选）
         elif col == '#4':
             if self.base_code == code:
                 return
+            # 只改新旧两行的“基准”格；旧基准若尚未物化，物化时自然不带标记
+            old_rowid = self._rowid_by_code.get(self.base_code)
             self.base_code = code
-            for it in self.listbox.get_children():
-                v = list(self.listbox.item(it, 'values'))
-                if len(v) >= 4:
-                    v[3] = '●' if v[0] == code else ''
-                    self.listbox.item(it, values=v)
+            if old_rowid:
+                self.listbox.set(old_rowid, 'base', '')
+            self.listbox.set(rowid, 'base', '●')
             # Show name+code in status if available
-            base_name = vals[1] if len(vals) >= 2 else code
+            base_name = self.listbox.set(rowid, 'name') or code
             self.status.set(f'已设置基准指数：{base_name}({code})')
 
     def _set_start_year_begin(self):
@@ -1863,15 +2552,62 @@ class IndexCompareTab(ttk.Frame):
         self.idx_end_var.set(date.today().strftime('%Y%m%d'))
 
     def start_compare(self):
-        # 直接读取轮播池（用户通过勾选控制）
-        rows = self.app.db.fetch_all("SELECT ts_code FROM index_watchlist WHERE in_pool = 1 ORDER BY ts_code")
-        if not rows:
+        # 轮播池快照随本页勾选同步维护；自选指数页改动过则重查一次
+        if self.app.index_pool_dirty:
+            self.app.flush_writes()
+            rows = self.app.db.fetch_all("SELECT ts_code FROM index_watchlist WHERE in_pool = 1")
+            self._pool_codes = {r['ts_code'] for r in rows}
+            self.app.index_pool_dirty = False
+        if not self._pool_codes:
             messagebox.showwarning('提示', '轮播池为空，请先在表格中勾选指数')
             return
-        self._candidates = [r['ts_code'] for r in rows]
+        self._candidates = sorted(self._pool_codes)
         self._pos = 0
+        # 后台预取整个轮播池的对比结果：与用户浏览时间重叠，
+        # 之后点"上一个/下一个"直接命中缓存不再卡UI。
+        # 预取是长任务，交给数据更新专用池，既不挤占快任务池，
+        # 也不会像每次点击新开线程那样在Database里累积连接
+        self.app.data_executor.submit(
+            self._prefetch_all,
+            self.base_code, list(self._candidates),
+            self.idx_start_var.get().strip(), self.idx_end_var.get().strip())
         self._plot_current()
 
+    def _clamp_range(self, base_code: str, code: str, start: str, end: str):
+        """静默计算两指数的可比区间（与_plot_current同款钳制，无弹窗）。"""
+        base_bounds = self.app.db.fetch_one(
+            "SELECT MIN(date) AS min_d, MAX(date) AS max_d FROM index_daily_price WHERE ts_code = ?",
+            (base_code,)
+        ) or {}
+        code_bounds = self.app.db.fetch_one(
+            "SELECT MIN(date) AS min_d, MAX(date) AS max_d FROM index_daily_price WHERE ts_code = ?",
+            (code,)
+        ) or {}
+        bmin = (base_bounds.get('min_d') or '')
+        bmax = (base_bounds.get('max_d') or '')
+        cmin = (code_bounds.get('min_d') or '')
+        cmax = (code_bounds.get('max_d') or '')
+        if not bmin or not bmax or not cmin or not cmax:
+            return None
+        clamped_start = max(start, max(bmin, cmin))
+        clamped_end = min(end, min(bmax, cmax))
+        if clamped_start > clamped_end:
+            return None
+        return clamped_start, clamped_end
+
+    def _prefetch_all(self, base_code, codes, start, end):
+        """工作线程：为轮播池中每个指数填充对比缓存。"""
+        if not base_code or not _valid_date8(start) or not _valid_date8(end):
+            return
+        with self._prefetch_lock:
+            for code in codes:
+                try:
+                    rng = self._clamp_range(base_code, code, start, end)
+                    if rng:
+                        self._get_compare(base_code, code, rng[0], rng[1])
+                except Exception:
+                    continue
+
     def _carousel(self, step):
         if not self._candidates:
             return
@@ -1883,7 +2619,7 @@ class IndexCompareTab(ttk.Frame):
             return
         start = self.idx_start_var.get().strip()
         end = self.idx_end_var.get().strip()
-        if len(start) != 8 or not start.isdigit() or len(end) != 8 or not end.isdigit():
+        if not _valid_date8(start) or not _valid_date8(end):
             messagebox.showwarning('提示', '日期格式应为YYYYMMDD')
             return
         base_code = self.base_code
@@ -1938,32 +2674,58 @@ class IndexCompareTab(ttk.Frame):
                 return
         except Exception:
             clamped_start, clamped_end = start, end
-        try:
-            self._start_busy('正在计算指数对比...')
-            from analysis.market_comparison import compare_indices
-            # 使用自动调整后的起止日期（若校验失败，则使用原输入）
+        # 计算放到工作线程：忙碌条能真正转动，UI不冻结；
+        # 请求序号防竞态——连点"下一个"时只绘制最后一次的结果
+        self._req_id += 1
+        req = self._req_id
+
+        def worker():
             try:
-                df = compare_indices(self.app.db, base_code, code, clamped_start, clamped_end)
-            except NameError:
-                df = compare_indices(self.app.db, base_code, code, start, end)
-            self.ax.clear()
+                df = self._get_compare(base_code, code, clamped_start, clamped_end)
+            except Exception as e:
+                self.after(0, lambda: (self._end_busy(), messagebox.showerror('错误', str(e))))
+                return
+            self.after(0, lambda: self._do_plot(req, df, base_code, code))
+
+        self._start_busy('正在计算指数对比...')
+        # 走共享线程池：每次点击新开线程会在Database里各留一条永不回收的连接
+        self.app.executor.submit(worker)
+
+    def _do_plot(self, req, df, base_code, code):
+        """UI线程侧绘制：丢弃已过期请求的结果。"""
+        try:
+            if req != self._req_id:
+                return
+            self._png_cache.clear()  # 图像即将变化，失效已渲染的保存缓存
             if df is None or df.empty:
+                for line in self._cmp_lines:
+                    line.set_data([], [])
                 self.status.set('指数对比：数据不足或无法对齐')
-                self.canvas.draw()
+                self.canvas.draw_idle()
                 return
-            # Plot ratio and MA
+            # 只更新数据：ratio 使用红色，其它指标使用默认颜色（线条在__init__创建）
+            x = df.attrs.get('x_num')
+            if x is None:
+                x = mdates.date2num(df['date'].values)
+            # 屏幕渲染用float32足够：set_data与Agg抗锯齿路径字节量减半
+            self._line_ratio.set_data(x, df['ratio_c'].to_numpy(dtype=np.float32))
             indicators = ['ratio']
-            # ratio 使用红色，其它指标使用默认颜色
-            self.ax.plot(df['date'], df['ratio_c'], label='ratio', color='red')
-            if 'c_ma10' in df.columns:
-                self.ax.plot(df['date'], df['c_ma10'], label='MA10')
-                indicators.append('MA10')
-            if 'c_ma20' in df.columns:
-                self.ax.plot(df['date'], df['c_ma20'], label='MA20')
-                indicators.append('MA20')
-            if 'c_ma60' in df.columns:
-                self.ax.plot(df['date'], df['c_ma60'], label='MA60', color='gray')
-                indicators.append('MA60')
+            for line, colname, label in (
+                    (self._line_ma10, 'c_ma10', 'MA10'),
+                    (self._line_ma20, 'c_ma20', 'MA20'),
+                    (self._line_ma60, 'c_ma60', 'MA60')):
+                present = colname in df.columns
+                line.set_visible(present)
+                if present:
+                    line.set_data(x, df[colname].to_numpy(dtype=np.float32))
+                    indicators.append(label)
+            # x范围在同区间轮播时不变：固定xlim只自动缩放y，省掉一半遍历
+            xlim = (float(x[0]), float(x[-1]))
+            if xlim != self._last_xlim:
+                self.ax.set_xlim(*xlim)
+                self._last_xlim = xlim
+            self.ax.relim(visible_only=True)
+            self.ax.autoscale_view(scalex=False, scaley=True)
             ind_text = ', '.join(indicators)
             # Display index names instead of codes in the chart title
             base_row = self.app.db.fetch_one("SELECT name FROM indices WHERE ts_code = ?", (base_code,))
@@ -1980,16 +2742,14 @@ class IndexCompareTab(ttk.Frame):
             except Exception:
                 range_text = ''
             self.ax.set_title(f'{code_name}({code}) vs {base_name}({base_code}) | 指标: {ind_text}' + (f' | {range_text}' if range_text else ''))
-            self.ax.set_xlabel('日期')
-            self.ax.set_ylabel('比值')
-            self.ax.legend()
+            self.ax.legend(handles=[l for l in self._cmp_lines if l.get_visible()])
             latest = df.iloc[-1]
             latest_date = latest['date'].strftime('%Y-%m-%d') if hasattr(latest['date'], 'strftime') else str(latest['date'])
             latest_ratio = latest['ratio_c']
             # 状态栏显示：当前序号、最新日期与比值、实际对比区间
             info_range = f' | {range_text}' if range_text else ''
             self.status.set(f'指数对比：{code_name}({code}) vs {base_name}({base_code}) | 截止{latest_date} 比值 {latest_ratio:.3f} | {self._pos+1}/{len(self._candidates)}{info_range}')
-            self.canvas.draw()
+            self.canvas.draw_idle()
         except Exception as e:
             messagebox.showerror('错误', str(e))
         finally:
@@ -2022,7 +2782,7 @@ class IndexCompareTab(ttk.Frame):
                 return
             inter_min = max(bmin, cmin)
             inter_max = min(bmax, cmax)
-            if len(start) != 8 or not start.isdigit() or len(end) != 8 or not end.isdigit():
+            if not _valid_date8(start) or not _valid_date8(end):
                 messagebox.showwarning('提示', '日期格式应为YYYYMMDD')
                 return
             if start > end:
@@ -2031,18 +2791,16 @@ class IndexCompareTab(ttk.Frame):
             clamped_start = start if start >= inter_min else inter_min
             clamped_end = end if end <= inter_max else inter_max
 
-            from analysis.market_comparison import compare_indices
-            df = compare_indices(self.app.db, base_code, code, clamped_start, clamped_end)
+            df = self._get_compare(base_code, code, clamped_start, clamped_end)
             if df is None or df.empty:
                 messagebox.showinfo('提示', '当前没有可导出的数据')
                 return
             import time
-            outdir = os.path.abspath(os.path.join(PROJECT_ROOT, 'output'))
-            os.makedirs(outdir, exist_ok=True)
+            outdir = _ensure_output_dir()
             ts = time.strftime('%Y%m%d_%H%M%S')
             filename = f'index_compare_{base_code}_vs_{code}_{clamped_start}_{clamped_end}_{ts}.csv'
             path = os.path.join(outdir, filename)
-            df.to_csv(path, index=False, encoding='utf-8-sig')
+            _df_to_csv_fast(df, path)
             self.status.set(f'已导出指数对比数据：{path}')
         except Exception as e:
             messagebox.showerror('导出失败', str(e))
@@ -2052,7 +2810,7 @@ class IndexCompareTab(ttk.Frame):
         if not path:
             return
         try:
-            fig.savefig(path, dpi=150, bbox_inches='tight')
+            _save_fig_png(fig, path, self._png_cache)
             self.status.set(f'图像已保存：{path}')
             if sys.platform.startswith('darwin'):
                 subprocess.call(['open', path])
@@ -2066,25 +2824,19 @@ class IndexCompareTab(ttk.Frame):
     def save_figure_quick(self, fig: Figure, base_name: str):
         try:
             import time
-            outdir = os.path.abspath(os.path.join(PROJECT_ROOT, 'output'))
-            os.makedirs(outdir, exist_ok=True)
+            outdir = _ensure_output_dir()
             ts = time.strftime('%Y%m%d_%H%M%S')
             path = os.path.join(outdir, f'{base_name}_{ts}.png')
-            fig.savefig(path, dpi=150, bbox_inches='tight')
+            _save_fig_png(fig, path, self._png_cache)
             self.status.set(f'图像已保存：{path}')
         except Exception as e:
             messagebox.showerror('保存失败', str(e))
 
     def _start_busy(self, msg: str):
-        self._busy_label_var.set(msg)
-        self._busy_frame.pack(fill='x', padx=10, pady=(0, 8))
-        self._busy_bar.start(10)
+        self.status.busy.start(msg)
 
     def _end_busy(self):
-        def stop():
-            self._busy_bar.stop()
-            self._busy_frame.forget()
-        self.after(0, stop)
+        self.after(0, self.status.busy.stop)
 
     def show_compare_help(self):
         """显示指数对比功能说明弹窗。"""
@@ -2328,6 +3080,7 @@ class SystemStatsTab(ttk.Frame):
 class BacktestTab(ttk.Frame):
     def __init__(self, master, app: AppState, status: StatusBar):
         super().__init__(master)
+        _ensure_matplotlib()  # 本页内嵌图表，确保Figure/mdates可用
         self.app = app
         self.status = status
 
@@ -2371,6 +3124,8 @@ class BacktestTab(ttk.Frame):
         pool_frame = ttk.Frame(self)
         pool_frame.pack(fill='x', padx=10, pady=4)
         pool = self.app.db.fetch_all("SELECT ts_code, name FROM watchlist WHERE in_pool = 1")
+        # 顺手预热AppState的池缓存，首次点“开始回测”不再查库
+        self.app._pool_codes_cache = [r['ts_code'] for r in pool]
         ttk.Label(pool_frame, text=f'当前回测池股票：{len(pool)} 只').pack(side='left')
         self.pool_tree = ttk.Treeview(pool_frame, columns=('ts_code', 'name'), show='headings', height=5)
         self.pool_tree.heading('ts_code', text='代码')
@@ -2378,8 +3133,14 @@ class BacktestTab(ttk.Frame):
         self.pool_tree.column('ts_code', width=120)
         self.pool_tree.column('name', width=160)
         self.pool_tree.pack(fill='x', padx=6)
-        for r in pool:
-            self.pool_tree.insert('', END, values=(r['ts_code'], r['name']))
+        # 插入期间隐藏显示列，整批行只触发一次列布局重算
+        self.pool_tree.configure(displaycolumns=())
+        try:
+            insert = self.pool_tree.insert
+            for r in pool:
+                insert('', END, values=(r['ts_code'], r['name']))
+        finally:
+            self.pool_tree.configure(displaycolumns='#all')
 
         # Run button
         ctrl = ttk.Frame(self)
@@ -2393,20 +3154,17 @@ class BacktestTab(ttk.Frame):
         ttk.Label(self, textvariable=self.metrics_var).pack(anchor='w', padx=12)
 
         # Plot area (equity + drawdown)
-        self.bt_fig = Figure(figsize=(8, 5.6), dpi=100)
+        # constrained_layout在绘制管线内解算，每次回测重绘不再手动tight_layout
+        self.bt_fig = Figure(figsize=(8, 5.6), dpi=100, constrained_layout=True)
         self.bt_ax1 = self.bt_fig.add_subplot(211)
         self.bt_ax2 = self.bt_fig.add_subplot(212, sharex=self.bt_ax1)
         self.bt_canvas = FigureCanvasTkAgg(self.bt_fig, master=self)
         self.bt_canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=6)
         self._last_bt_result = None
+        self._png_cache = {}  # (figure,dpi)->已渲染PNG字节，重复保存免二次渲染
+        # 回测结果按完整参数组合记忆：同参重跑直接复用，LRU淘汰最旧的
+        self._bt_result_cache = OrderedDict()
 
-        # Busy indicator
-        self._busy_frame = ttk.Frame(self)
-        self._busy_label_var = StringVar(value='')
-        self._busy_label = ttk.Label(self._busy_frame, textvariable=self._busy_label_var)
-        self._busy_bar = ttk.Progressbar(self._busy_frame, mode='indeterminate', length=240)
-        self._busy_label.pack(side='left', padx=(8, 6))
-        self._busy_bar.pack(side='left', padx=6)
 
     def run_backtest(self):
         try:
@@ -2417,15 +3175,14 @@ class BacktestTab(ttk.Frame):
             return
         start = self.bt_start_var.get().strip()
         end = self.bt_end_var.get().strip()
-        if len(start) != 8 or not start.isdigit() or len(end) != 8 or not end.isdigit():
+        if not _valid_date8(start) or not _valid_date8(end):
             messagebox.showwarning('提示', '日期格式应为YYYYMMDD')
             return
         strategy = self.bt_strategy_var.get()
         if not strategy:
             messagebox.showwarning('提示', '请选择策略')
             return
-        pool_rows = self.app.db.fetch_all("SELECT ts_code FROM watchlist WHERE in_pool = 1")
-        codes = [r['ts_code'] for r in pool_rows]
+        codes = self.app.watchlist_pool_codes()
         if not codes:
             messagebox.showwarning('提示', '回测池为空，请先在自选股中选择回测池')
             return
@@ -2443,51 +3200,82 @@ class BacktestTab(ttk.Frame):
         except Exception:
             pass
 
+        norm = self.bt_norm_var.get()
+        try:
+            # 全量输入参数构成缓存键；参数值不可哈希时放弃缓存
+            cache_key = (strategy, tuple(codes), start, end, init_cap, maxpos, norm,
+                         tuple(sorted(bt_params.items())))
+            hash(cache_key)
+        except Exception:
+            cache_key = None
+
         def task():
-            from backtest.engine import run_backtest
-            self.status.set('正在运行回测，请稍候...')
-            try:
-                result = run_backtest(strategy, codes, start, end, init_cap, maxpos, self.bt_norm_var.get(), strategy_params=bt_params)
-            except Exception as e:
-                self.status.set('回测失败')
-                messagebox.showerror('错误', str(e))
-                return
-            self.status.set('回测完成')
+            result = self._bt_result_cache.get(cache_key) if cache_key is not None else None
+            if result is not None:
+                self._bt_result_cache.move_to_end(cache_key)
+                self.status.set('回测完成（同参数复用上次结果）')
+            else:
+                self.status.set('正在运行回测，请稍候...')
+                try:
+                    result = _run_backtest_fn()(strategy, codes, start, end, init_cap, maxpos, norm, strategy_params=bt_params)
+                except Exception as e:
+                    self.status.set('回测失败')
+                    messagebox.showerror('错误', str(e))
+                    return
+                if cache_key is not None:
+                    self._bt_result_cache[cache_key] = result
+                    while len(self._bt_result_cache) > 8:
+                        self._bt_result_cache.popitem(last=False)
+                self.status.set('回测完成')
             metrics = result.get('metrics', {})
             self.metrics_var.set(
                 f"总收益: {metrics.get('total_return', 0):.2f}% | 年化: {metrics.get('annual_return', 0):.2f}% | 最大回撤: {metrics.get('max_drawdown', 0):.2f}% | 夏普: {metrics.get('sharpe_ratio') or 0:.2f} | 交易数: {metrics.get('total_trades', 0)} | 胜率: {metrics.get('win_rate', 0):.2f}%"
             )
             curves = result.get('curves', {})
+            # 日期解析与date2num在工作线程完成，UI线程的draw只拿浮点数组画线；
+            # 四条曲线的日期轴往往完全相同，按内容去重只解析一次
+            pd = _pandas()
+            _dt_memo = {}
+
+            def _xy(curve):
+                if not curve.get('dates'):
+                    return None
+                key = tuple(curve['dates'])
+                x = _dt_memo.get(key)
+                if x is None:
+                    x = mdates.date2num(pd.to_datetime(curve['dates'], cache=True).values)
+                    _dt_memo[key] = x
+                # 屏幕渲染用float32足够，CSV导出仍保留原始精度
+                return x, np.asarray(curve['values'], dtype=np.float32)
+
+            se_xy = _xy(curves.get('strat_equity', {}))
+            he_xy = _xy(curves.get('hs300_equity', {}))
+            sd_xy = _xy(curves.get('strat_dd', {}))
+            hd_xy = _xy(curves.get('hs300_dd', {}))
+
             # draw plots on UI thread
             def draw():
+                self._png_cache.clear()  # 图像即将变化，失效已渲染的保存缓存
                 self.bt_ax1.clear(); self.bt_ax2.clear()
                 # Equity
-                se = curves.get('strat_equity', {})
-                he = curves.get('hs300_equity', {})
-                import pandas as pd
-                if se.get('dates'):
-                    s = pd.Series(se['values'], index=pd.to_datetime(se['dates']))
-                    self.bt_ax1.plot(s.index, s.values, label='策略净值', color='royalblue')
-                if he.get('dates'):
-                    h = pd.Series(he['values'], index=pd.to_datetime(he['dates']))
-                    self.bt_ax1.plot(h.index, h.values, label='沪深300', color='firebrick', linestyle='--')
+                if se_xy:
+                    self.bt_ax1.plot(se_xy[0], se_xy[1], label='策略净值', color='royalblue')
+                if he_xy:
+                    self.bt_ax1.plot(he_xy[0], he_xy[1], label='沪深300', color='firebrick', linestyle='--')
+                self.bt_ax1.xaxis_date()
                 self.bt_ax1.set_title('净值曲线')
                 self.bt_ax1.legend()
                 # Drawdown
-                sd = curves.get('strat_dd', {})
-                hd = curves.get('hs300_dd', {})
-                if sd.get('dates'):
-                    sdd = pd.Series(sd['values'], index=pd.to_datetime(sd['dates']))
-                    self.bt_ax2.plot(sdd.index, sdd.values, label='策略回撤', color='royalblue')
-                if hd.get('dates'):
-                    hdd = pd.Series(hd['values'], index=pd.to_datetime(hd['dates']))
-                    self.bt_ax2.plot(hdd.index, hdd.values, label='沪深300回撤', color='firebrick', linestyle='--')
+                if sd_xy:
+                    self.bt_ax2.plot(sd_xy[0], sd_xy[1], label='策略回撤', color='royalblue')
+                if hd_xy:
+                    self.bt_ax2.plot(hd_xy[0], hd_xy[1], label='沪深300回撤', color='firebrick', linestyle='--')
+                self.bt_ax2.xaxis_date()
                 self.bt_ax2.set_title('回撤'); self.bt_ax2.legend()
-                self.bt_fig.tight_layout()
-                self.bt_canvas.draw()
+                self.bt_canvas.draw_idle()
             self.bt_canvas.get_tk_widget().after(0, draw)
         self._start_busy('正在运行回测...')
-        threading.Thread(target=lambda: (task(), self._end_busy()), daemon=True).start()
+        self.app.executor.submit(lambda: (task(), self._end_busy()))
 
     # ---- Backtest strategy params helpers ----
     def _bt_param_specs(self):
@@ -2629,7 +3417,7 @@ class BacktestTab(ttk.Frame):
         if not path:
             return
         try:
-            self.bt_fig.savefig(path, dpi=150, bbox_inches='tight')
+            _save_fig_png(self.bt_fig, path, self._png_cache)
             self.status.set(f'图像已保存：{path}')
             if sys.platform.startswith('darwin'):
                 subprocess.call(['open', path])
@@ -2641,11 +3429,10 @@ class BacktestTab(ttk.Frame):
             messagebox.showerror('保存失败', str(e))
 
     def open_backtest_csvs(self):
-        from backtest.engine import run_backtest  # for typing reference only
         # We rerun a quick check to get paths from last run if available
         # In a refined version, we could store paths on last run
         # For now, prompt user to locate files in output/ folder
-        outdir = os.path.abspath(os.path.join(PROJECT_ROOT, 'output'))
+        outdir = _OUTPUT_DIR
         if not os.path.isdir(outdir):
             messagebox.showinfo('提示', '暂未发现输出目录。请先运行一次回测或手动打开相应CSV。')
             return
@@ -2660,15 +3447,10 @@ class BacktestTab(ttk.Frame):
             messagebox.showinfo('提示', f'输出目录：{outdir}')
 
     def _start_busy(self, msg: str):
-        self._busy_label_var.set(msg)
-        self._busy_frame.pack(fill='x', padx=10, pady=(0, 8))
-        self._busy_bar.start(10)
+        self.status.busy.start(msg)
 
     def _end_busy(self):
-        def stop():
-            self._busy_bar.stop()
-            self._busy_frame.forget()
-        self.after(0, stop)
+        self.after(0, self.status.busy.stop)
 
     def _set_bt_year_begin(self):
         from datetime import date
@@ -2681,12 +3463,35 @@ class BacktestTab(ttk.Frame):
 
 
 class RiskTab(ttk.Frame):
+    # 违规表列规格：类常量，配置集中一处
+    _VIOL_COLS = (
+        ('type', '类型', 120, 'center'),
+        ('ts_code', '代码', 120, 'center'),
+        ('industry', '行业', 140, 'center'),
+        ('ratio', '占比', 80, 'center'),
+        ('limit', '限制', 80, 'center'),
+    )
+    # 指标文案模板：常量化，刷新时只做数值格式化
+    _METRIC_FMT = (
+        ('var95', 'var_95', '95% VaR: {:.2f}%'),
+        ('var99', 'var_99', '99% VaR: {:.2f}%'),
+        ('cvar95', 'cvar_95', '95% CVaR: {:.2f}%'),
+        ('hhi', 'hhi', '行业集中度(HHI): {:.2f}'),
+    )
+
     def __init__(self, master, app: AppState, status: StatusBar):
         super().__init__(master)
         self.app = app
         self.status = status
-
-        ttk.Button(self, text='开始分析', command=self.run_analysis).pack(anchor='w', padx=10, pady=8)
+        # 风险报告缓存：键为组合签名（持仓+现金+最新快照日），持仓不变时重复点击秒回
+        self._risk_cache = {}
+        # 防重入：分析进行中时忽略重复点击
+        self._analysis_running = threading.Event()
+        # 违规列表item复用池：跨次分析就地更新，避免整树重建
+        self._viol_iids = []
+
+        self._analyze_btn = ttk.Button(self, text='开始分析', command=self.run_analysis)
+        self._analyze_btn.pack(anchor='w', padx=10, pady=8)
         self.metrics = {
             'var95': StringVar(value='95% VaR: -'),
             'var99': StringVar(value='99% VaR: -'),
@@ -2697,53 +3502,116 @@ class RiskTab(ttk.Frame):
             ttk.Label(self, textvariable=self.metrics[key]).pack(anchor='w', padx=12)
 
         ttk.Label(self, text='风险违规').pack(anchor='w', padx=10, pady=(10, 2))
-        self.viol_tree = ttk.Treeview(self, columns=('type', 'ts_code', 'industry', 'ratio', 'limit'), show='headings', height=6)
-        for col, text, w in [
-            ('type', '类型', 120), ('ts_code', '代码', 120), ('industry', '行业', 140), ('ratio', '占比', 80), ('limit', '限制', 80)
-        ]:
-            self.viol_tree.heading(col, text=text)
-            self.viol_tree.column(col, width=w, anchor='center')
+        self.viol_tree = ttk.Treeview(self, columns=[c[0] for c in self._VIOL_COLS], show='headings', height=6)
+        _configure_treeview_columns(self.viol_tree, self._VIOL_COLS)
         self.viol_tree.pack(fill='x', padx=10, pady=6)
 
-        # Busy indicator
+        # Busy indicator（确定模式：按分析阶段推进，避免动画定时器空转）
         self._busy_frame = ttk.Frame(self)
         self._busy_label_var = StringVar(value='')
         self._busy_label = ttk.Label(self._busy_frame, textvariable=self._busy_label_var)
-        self._busy_bar = ttk.Progressbar(self._busy_frame, mode='indeterminate', length=200)
+        self._busy_bar = ttk.Progressbar(self._busy_frame, mode='determinate', maximum=100, length=200)
         self._busy_label.pack(side='left', padx=(8, 6))
         self._busy_bar.pack(side='left', padx=6)
 
+    def _risk_cache_key(self):
+        """组合签名：持仓明细 + 现金 + 最新快照日期，任一变化即视为缓存失效。"""
+        pm = self.app.pm
+        holdings = tuple(sorted(
+            (code, float(pos.get('qty') or 0)) for code, pos in (pm.positions or {}).items()
+        ))
+        try:
+            last_snap = pm.get_last_snapshot_date()
+        except Exception:
+            last_snap = None
+        return (holdings, pm.cash, last_snap)
+
     def run_analysis(self):
-        def task():
-            self.status.set('正在进行风险分析...')
-            try:
-                report = self.app.ra.analyze_portfolio_risk()
-            except Exception as e:
-                self.status.set('风险分析失败')
-                messagebox.showerror('错误', str(e))
-                return
-            self.status.set('风险分析完成')
-            def fill():
-                self.metrics['var95'].set(f"95% VaR: {report['var_95']:.2f}%")
-                self.metrics['var99'].set(f"99% VaR: {report['var_99']:.2f}%")
-                self.metrics['cvar95'].set(f"95% CVaR: {report['cvar_95']:.2f}%")
-                self.metrics['hhi'].set(f"行业集中度(HHI): {report['hhi']:.2f}")
-                for item in self.viol_tree.get_children():
-                    self.viol_tree.delete(item)
-                for v in report.get('violations', []):
-                    self.viol_tree.insert('', END, values=(v.get('type'), v.get('ts_code'), v.get('industry'), f"{v.get('ratio', 0):.3f}", f"{v.get('limit', 0):.3f}"))
-            self.viol_tree.after(0, fill)
+        if self._analysis_running.is_set():
+            return
+        self._analysis_running.set()
+        try:
+            self._analyze_btn.configure(state='disabled')
+        except Exception:
+            pass
         self._start_busy('正在进行风险分析...')
-        threading.Thread(target=lambda: (task(), self._end_busy()), daemon=True).start()
+        # 绑定方法引用，避免每次点击分配新的lambda/闭包
+        self.app.executor.submit(self._run_analysis_worker)
+
+    def _run_analysis_worker(self):
+        try:
+            self._analysis_task()
+        finally:
+            self._analysis_running.clear()
+            self._end_busy()
+            self.after(0, self._enable_analyze_btn)
+
+    def _enable_analyze_btn(self):
+        try:
+            self._analyze_btn.configure(state='normal')
+        except Exception:
+            pass
+
+    def _analysis_task(self):
+        self.status.set('正在进行风险分析...')
+        try:
+            key = self._risk_cache_key()
+            report = self._risk_cache.get(key)
+            if report is None:
+                report = self.app.ra.analyze_portfolio_risk(progress_cb=self._set_progress)
+                self._risk_cache[key] = report
+            else:
+                self._set_progress(100)
+        except Exception as e:
+            self.status.set('风险分析失败')
+            messagebox.showerror('错误', str(e))
+            return
+        self.status.set('风险分析完成')
+        # 行内容在工作线程预格式化，主线程只做插入
+        pre_rows = [
+            (v.get('type'), v.get('ts_code'), v.get('industry'),
+             f"{v.get('ratio', 0):.3f}", f"{v.get('limit', 0):.3f}")
+            for v in report.get('violations', [])
+        ]
+        # after_idle：等事件队列空闲时一次性提交全部UI变更，让Tk合并重绘
+        self.after_idle(self._fill_results, report, pre_rows)
+
+    def _fill_results(self, report, pre_rows):
+        try:
+            self.configure(cursor='watch')
+            for key, rkey, fmt in self._METRIC_FMT:
+                self.metrics[key].set(_fmt_metric(fmt, round(report[rkey], 2)))
+            # 批量更新：先摘下Treeview；已有item就地复用，多余的detach留待下次
+            self.viol_tree.pack_forget()
+            for i, row in enumerate(pre_rows):
+                if i < len(self._viol_iids):
+                    iid = self._viol_iids[i]
+                    self.viol_tree.item(iid, values=row)
+                    self.viol_tree.move(iid, '', i)  # 若此前被detach则重新挂回
+                else:
+                    self._viol_iids.append(self.viol_tree.insert('', END, values=row))
+            extras = self._viol_iids[len(pre_rows):]
+            if extras:
+                self.viol_tree.detach(*extras)
+            self.viol_tree.pack(fill='x', padx=10, pady=6)
+        finally:
+            try:
+                self.configure(cursor='')
+            except Exception:
+                pass
 
     def _start_busy(self, msg: str):
         self._busy_label_var.set(msg)
         self._busy_frame.pack(fill='x', padx=10, pady=(0, 8))
-        self._busy_bar.start(10)
+        self._busy_bar.configure(value=0)
+
+    def _set_progress(self, pct: float):
+        # 可能从工作线程调用，统一切回Tk主线程更新
+        self.after(0, lambda: self._busy_bar.configure(value=pct))
 
     def _end_busy(self):
         def stop():
-            self._busy_bar.stop()
+            self._busy_bar.configure(value=0)
             self._busy_frame.forget()
         self.after(0, stop)
 
@@ -2758,28 +3626,40 @@ class MainApp(Tk):
             pass
 
         self.app = AppState()
+
+        # 统一主题样式：启动时配置一次，各页签的控件直接命中缓存的样式表
+        try:
+            style = ttk.Style(self)
+            style.configure('TButton', padding=(8, 4))
+            style.configure('Treeview', rowheight=22)
+        except Exception:
+            pass
+
         self.status = StatusBar(self)
         self.status.pack(fill='x', side='bottom')
 
         nb = ttk.Notebook(self)
         nb.pack(fill='both', expand=True)
-        self.data_tab = DataTab(nb, self.app, self.status)
-        self.watchlist_tab = WatchlistTab(nb, self.app, self.status)
-        self.portfolio_tab = PortfolioTab(nb, self.app, self.status)
-        self.strategy_tab = StrategyTab(nb, self.app, self.status)
-        self.index_compare_tab = IndexCompareTab(nb, self.app, self.status)
-        self.backtest_tab = BacktestTab(nb, self.app, self.status)
-        self.risk_tab = RiskTab(nb, self.app, self.status)
-        self.system_stats_tab = SystemStatsTab(nb, self.app, self.status)
-
-        nb.add(self.data_tab, text='数据管理')
-        nb.add(self.watchlist_tab, text='自选列表管理')
-        nb.add(self.portfolio_tab, text='资产管理')
-        nb.add(self.strategy_tab, text='选股策略')
-        nb.add(self.index_compare_tab, text='指数对比')
-        nb.add(self.backtest_tab, text='回测引擎')
-        nb.add(self.risk_tab, text='风险分析')
-        nb.add(self.system_stats_tab, text='系统统计')
+        self._nb = nb
+        # 页签懒加载：先挂空容器占位，首次切换到某页时才构建真实内容
+        self.tabs = {}
+        self._pending_tabs = {}
+        for text, cls in [
+            ('数据管理', DataTab),
+            ('自选列表管理', WatchlistTab),
+            ('资产管理', PortfolioTab),
+            ('选股策略', StrategyTab),
+            ('指数对比', IndexCompareTab),
+            ('回测引擎', BacktestTab),
+            ('风险分析', RiskTab),
+            ('系统统计', SystemStatsTab),
+        ]:
+            holder = ttk.Frame(nb)
+            nb.add(holder, text=text)
+            self._pending_tabs[str(holder)] = (holder, text, cls)
+        nb.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        # 当前（首个）页签立即构建
+        self._on_tab_changed()
 
         # Exit button
         toolbar = ttk.Frame(self)
@@ -2788,6 +3668,30 @@ class MainApp(Tk):
 
         self.status.set('系统准备就绪。')
 
+    def _on_tab_changed(self, _event=None):
+        entry = self._pending_tabs.pop(self._nb.select(), None)
+        if not entry:
+            return
+        holder, text, cls = entry
+        frame = cls(holder, self.app, self.status)
+        frame.pack(fill='both', expand=True)
+        self.tabs[text] = frame
+
+    def destroy(self):
+        try:
+            self.app.flush_writes()  # 退出前清空后台写队列，勾选状态不丢
+        except Exception:
+            pass
+        try:
+            self.app.executor.shutdown(wait=False)
+        except Exception:
+            pass
+        try:
+            self.app.data_executor.shutdown(wait=False)
+        except Exception:
+            pass
+        super().destroy()
+
 
 if __name__ == '__main__':
     MainApp().mainloop()
@@ -51,16 +51,18 @@ class PortfolioManager:
     def save_portfolio(self):
         if not self.is_initialized():
             return
-        self.db.execute("DELETE FROM portfolio WHERE portfolio_name = ?", (self.portfolio_name,))
         data_to_insert = [
             (self.portfolio_name, ts_code, pos['qty'], pos['cost'], pos.get('target_price'))
             for ts_code, pos in self.positions.items()
         ]
         data_to_insert.append((self.portfolio_name, 'CASH', 1, self.cash, None))
-        self.db.executemany(
-            "INSERT INTO portfolio (portfolio_name, ts_code, qty, cost, target_price) VALUES (?, ?, ?, ?, ?)",
-            data_to_insert
-        )
+        # 删旧+插新放进一个事务：只提交一次，也避免中途崩溃丢整张持仓表
+        with self.db.transaction():
+            self.db.execute("DELETE FROM portfolio WHERE portfolio_name = ?", (self.portfolio_name,))
+            self.db.executemany(
+                "INSERT INTO portfolio (portfolio_name, ts_code, qty, cost, target_price) VALUES (?, ?, ?, ?, ?)",
+                data_to_insert
+            )
 
     def update_cash(self, amount: float):
         if not self.is_initialized():
@@ -191,6 +193,23 @@ class PortfolioManager:
         self.positions[ts_code]['target_price'] = float(target_price)
         self.save_portfolio()
 
+    def set_target_prices_bulk(self, updates):
+        """批量更新多只持仓的目标价，只持久化一次。
+
+        updates: [(ts_code, target_price), ...]。先整体校验再统一写入，
+        N条修改只触发一次持仓表重写与提交。
+        """
+        if not self.is_initialized():
+            raise ValueError("Portfolio not initialized.")
+        for ts_code, target_price in updates:
+            if ts_code not in self.positions:
+                raise ValueError("Position not found.")
+            if target_price is None or target_price <= 0:
+                raise ValueError("目标价必须为正数。")
+        for ts_code, target_price in updates:
+            self.positions[ts_code]['target_price'] = float(target_price)
+        self.save_portfolio()
+
     def _current_position_start_date(self, ts_code: str) -> Optional[str]:
         """Return the start date (YYYYMMDD) of the current open position for a symbol.
         It scans trades chronologically and finds the date when cumulative qty transitions from 0 to >0 for the last time.
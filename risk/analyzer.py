@@ -8,6 +8,30 @@ import logging
 
 settings = get_settings()
 
+try:  # Numba 为可选依赖：存在时JIT编译数值内核，缺失时回退纯NumPy
+    from numba import njit
+except Exception:
+    njit = None
+
+
+def _risk_kernel(arr):
+    """收益率数组上的一次性数值归约：均值、样本标准差、5%尾部均值(CVaR)。"""
+    n = arr.size
+    mean = arr.mean()
+    std_dev = arr.std() * np.sqrt(n / (n - 1.0)) if n > 1 else 0.0
+    # 5%尾部均值：只需前k个次序统计量，用partition(O(N))替代全排序/插值分位
+    k = int(np.ceil(0.05 * n))
+    if k < 1:
+        k = 1
+    part = np.partition(arr, k - 1)
+    cvar = np.abs(part[:k].mean())
+    return mean, std_dev, cvar
+
+
+if njit is not None:
+    _risk_kernel = njit(fastmath=True, cache=True)(_risk_kernel)
+
+
 class RiskAnalyzer:
     def __init__(self, portfolio_manager: PortfolioManager):
         self.pm = portfolio_manager
@@ -50,27 +74,46 @@ class RiskAnalyzer:
         base = self.pm.cash if self.pm.cash and self.pm.cash != 0 else abs(daily_pnl).mean() or 1.0
         return (daily_pnl / base)
 
-    def analyze_portfolio_risk(self) -> Dict[str, Any]:
-        """分析投资组合风险"""
+    def analyze_portfolio_risk(self, progress_cb=None) -> Dict[str, Any]:
+        """分析投资组合风险。
+
+        progress_cb: 可选回调，按阶段传入 0-100 的进度百分比。
+        """
+        def _progress(pct: float):
+            if progress_cb:
+                try:
+                    progress_cb(pct)
+                except Exception:
+                    pass
+
         report = self.pm.generate_portfolio_report()
         summary = report['summary']
         positions = report['positions']
-        
-        # 获取投资组合收益率
+        _progress(25)
+
+        # 获取投资组合收益率（只取一次，三个指标共享同一份数组与统计矩）
         returns = self.get_portfolio_returns()
+        _progress(50)
+        arr = returns.to_numpy(dtype=float) if not returns.empty else np.empty(0)
+
+        # 计算风险指标：数值归约集中在一个内核里（可被Numba JIT），矩只算一次
+        if arr.size:
+            mean, std_dev, cvar = _risk_kernel(arr)
+            var_95 = (mean - norm.ppf(0.05) * std_dev) * 100
+            var_99 = (mean - norm.ppf(0.01) * std_dev) * 100
+            cvar_95 = float(cvar) * 100
+        else:
+            var_95 = var_99 = cvar_95 = 0.0
         
-        # 计算风险指标
-        var_95 = self.calculate_var(returns)
-        var_99 = self.calculate_var(returns, confidence_level=0.99)
-        cvar_95 = self.calculate_cvar(returns)
-        
-        # 计算行业集中度 (HHI指数)
-        hhi = 0
+        # 计算行业集中度 (HHI指数)：权重向量一次点积，替代逐项累加
+        hhi = 0.0
         if summary.get('investment_value', 0) > 0:
             industry_dist = summary.get('industry_distribution', {})
-            for percentage in industry_dist.values():
-                hhi += (percentage / 100) ** 2
-        
+            w = np.fromiter(industry_dist.values(), dtype=np.float64) / 100.0
+            hhi = float(w @ w)
+        _progress(75)
+
+
         # 检查是否违反风险限制
         violations = []
         total_value = summary.get('total_value', 0)
@@ -99,6 +142,7 @@ class RiskAnalyzer:
                         'limit': settings.MAX_INDUSTRY_EXPOSURE
                     })
         
+        _progress(100)
         return {
             'portfolio_name': self.pm.portfolio_name,
             'var_95': var_95,
@@ -41,10 +41,13 @@ class StrategyManager:
         """按名称获取策略类"""
         return self.strategies.get(name)
 
-    def run_screening(self, strategy_name: str, ts_codes: List[str], strategy_params: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    def run_screening(self, strategy_name: str, ts_codes: List[str], strategy_params: Dict[str, Any] | None = None,
+                      progress_cb=None) -> List[Dict[str, Any]]:
         """
         为“选股”功能运行策略。
         它只检查每个股票在最新数据点上是否产生买入信号。
+        progress_cb(done, total) 为可选回调，每处理若干只股票调用一次，
+        供界面展示确定进度（在调用方线程执行，回调应自行切回UI线程）。
         """
         strategy_class = self.get_strategy_class(strategy_name)
         if not strategy_class:
@@ -54,7 +57,13 @@ class StrategyManager:
         selected_stocks = []
         module = self.strategy_modules.get(strategy_name)
         has_custom_screen = hasattr(module, 'screen_stock') if module else False
-        for ts_code in ts_codes:
+        total = len(ts_codes)
+        for i, ts_code in enumerate(ts_codes):
+            if progress_cb is not None and i % 10 == 0:
+                try:
+                    progress_cb(i, total)
+                except Exception:
+                    progress_cb = None  # 回调异常不应中断选股
             # 获取单个股票的最新数据 (例如，过去一年的数据)
             end_date = datetime.now().strftime('%Y%m%d')
             # 要求至少 MIN_REQUIRED_BARS + 一些缓冲；按一年回看已足够
@@ -0,0 +1,38 @@
+import numpy as np
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """LTTB (Largest-Triangle-Three-Buckets) 降采样，返回保留点的下标数组。
+
+    把序列分成 n_out 个桶，首尾各保留一点，其余每桶选与前一保留点、
+    下一桶均值点构成三角形面积最大的点，视觉形状保持最好。
+    当 n_out >= 序列长度或 n_out < 3 时原样返回全部下标。
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n, dtype=np.int64)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        lo = int(i * every) + 1
+        hi = int((i + 1) * every) + 1
+        # 下一桶的均值点（最后一桶退化为终点）
+        nlo = hi
+        nhi = min(int((i + 2) * every) + 1, n)
+        if nhi > nlo:
+            avg_x = x[nlo:nhi].mean()
+            avg_y = y[nlo:nhi].mean()
+        else:
+            avg_x = x[n - 1]
+            avg_y = y[n - 1]
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs((x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
@@ -0,0 +1,37 @@
+import numpy as np
+
+try:  # Numba 为可选依赖：存在时JIT编译数值内核，缺失时回退纯NumPy循环
+    from numba import njit
+except Exception:
+    njit = None
+
+
+def running_drawdown(values):
+    """净值序列的逐日回撤（相对历史峰值的跌幅，0~1的正数）。"""
+    n = values.size
+    out = np.empty(n, dtype=np.float64)
+    peak = -np.inf
+    for i in range(n):
+        v = values[i]
+        if v > peak:
+            peak = v
+        out[i] = (peak - v) / peak if peak > 0 else 0.0
+    return out
+
+
+def daily_returns(values):
+    """净值序列的逐日简单收益率，长度为 len(values)-1。"""
+    n = values.size
+    if n < 2:
+        return np.empty(0, dtype=np.float64)
+    out = np.empty(n - 1, dtype=np.float64)
+    for i in range(1, n):
+        prev = values[i - 1]
+        out[i - 1] = (values[i] - prev) / prev if prev != 0 else 0.0
+    return out
+
+
+if njit is not None:
+    # cache=True：编译产物落盘，进程重启后不再付首调编译开销
+    running_drawdown = njit(fastmath=True, cache=True)(running_drawdown)
+    daily_returns = njit(fastmath=True, cache=True)(daily_returns)